@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+r"""
+Compare sequential and parallel csv_to_nested_dict on a generated file.
+
+    ./benchmark_csv.py --rows 2000000 --workers 1 2 4 8
+"""
+import argparse
+import csv
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from praline.config.helpers import csv_to_nested_dict
+
+
+def write_csv(path: Path, rows: int):
+    with path.open("w", newline="") as ostream:
+        writer = csv.writer(ostream)
+        writer.writerow(["id", "region", "name", "note"])
+        for i in range(rows):
+            note = f"multi\nline, \"quoted\" {i}" if i % 100 == 0 else f"note {i}"
+            writer.writerow([i, i % 16, f"name-{i}", note])
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, os.cpu_count()])
+    parser.add_argument("--chunk-size", type=int, default=1 << 22)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "benchmark.csv"
+        write_csv(path, args.rows)
+        print(f"{path.stat().st_size / 1e6:.1f} MB, {args.rows} rows")
+
+        baseline = None
+        for workers in args.workers:
+            start = time.perf_counter()
+            result = csv_to_nested_dict(path, ["id", "region"], workers=workers, chunk_size=args.chunk_size)
+            elapsed = time.perf_counter() - start
+            baseline = baseline or elapsed
+            print(f"workers={workers:<3} {elapsed:8.2f}s  speedup={baseline / elapsed:5.2f}x  keys={len(result)}")
+
+
+if __name__ == "__main__":
+    exit(main())
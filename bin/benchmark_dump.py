@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+r"""
+Compare the compiled dumpers with dataclasses.asdict + json.dumps on a large
+generated config.
+
+    ./benchmark_dump.py --services 2000 --routes 20
+"""
+import argparse
+import json
+import timeit
+from dataclasses import asdict, dataclass
+
+from praline.config import AppConfigBase
+from praline.config.dump import dump_dataclass, dumps_binary, dumps_json
+
+
+@dataclass
+class Route:
+    path: str = None
+    timeout: int = None
+    retries: int = None
+
+
+@dataclass
+class Service:
+    host: str = None
+    port: int = None
+    routes: list[Route] = None
+    labels: dict[str, str] = None
+
+
+@dataclass
+class AppConfig(AppConfigBase):
+    name: str = None
+    services: dict[str, Service] = None
+
+
+def build(services: int, routes: int) -> AppConfig:
+    return AppConfig.load(config={
+        "name": "benchmark",
+        "services": {
+            f"service-{s}": {
+                "host": f"host-{s}.example.com",
+                "port": 8000 + s,
+                "routes": [{"path": f"/r/{r}", "timeout": r, "retries": 3} for r in range(routes)],
+                "labels": {"team": f"team-{s % 10}", "tier": "backend"},
+            }
+            for s in range(services)
+        },
+    })
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--services", type=int, default=1000)
+    parser.add_argument("--routes", type=int, default=20)
+    parser.add_argument("--number", type=int, default=10)
+    args = parser.parse_args()
+
+    app_config = build(args.services, args.routes)
+    candidates = {
+        "asdict": lambda: asdict(app_config),
+        "dump_dataclass": lambda: dump_dataclass(app_config),
+        "asdict + json.dumps": lambda: json.dumps(asdict(app_config), default=str),
+        "dumps_json": lambda: dumps_json(app_config),
+        "dumps_binary": lambda: dumps_binary(app_config),
+    }
+    for label, fn in candidates.items():
+        elapsed = min(timeit.repeat(fn, number=args.number, repeat=3)) / args.number
+        print(f"{label:<22} {elapsed * 1000:9.2f} ms")
+    print(f"json size:   {len(dumps_json(app_config)):>10} bytes")
+    print(f"binary size: {len(dumps_binary(app_config)):>10} bytes")
+
+
+if __name__ == "__main__":
+    exit(main())
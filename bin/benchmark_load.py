@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+r"""
+Measure AppConfig.load throughput across thread counts. On a free-threaded
+CPython build (e.g. python3.13t) throughput should scale with cores; with the
+GIL it stays roughly flat.
+
+    ./benchmark_load.py --loads 20000 --threads 1 2 4 8
+"""
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+from praline.config import AppConfigBase
+
+
+@dataclass
+class Service:
+    host: str = None
+    port: int = None
+
+
+@dataclass
+class AppConfig(AppConfigBase):
+    name: str = None
+    services: dict[str, Service] = None
+
+
+def load(i: int) -> AppConfig:
+    return AppConfig.load(
+        config={
+            "name": f"tenant-{i}",
+            "services": {f"service-{s}": {"host": f"host-{s}", "port": s} for s in range(10)},
+            "env": {"home": "HOME"},
+        },
+        environ={"HOME": f"/home/tenant-{i}"},
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--loads", type=int, default=10_000)
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, os.cpu_count()])
+    args = parser.parse_args()
+
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"Python {sys.version.split()[0]}, GIL {'enabled' if gil else 'disabled'}, {os.cpu_count()} CPUs")
+    baseline = None
+    for threads in args.threads:
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            start = time.perf_counter()
+            for _ in executor.map(load, range(args.loads)):
+                pass
+            elapsed = time.perf_counter() - start
+        throughput = args.loads / elapsed
+        baseline = baseline or throughput
+        print(f"threads={threads:<3} {throughput:10.0f} loads/s  scaling={throughput / baseline:5.2f}x")
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -1,7 +1,8 @@
 from ._base import (AppConfigBase, AppConfigCore, AppConfigurationSource,
                     AppConfigurationType, EnvConfig, load_dataclass)
-from .env import EnvValue, SecureEnvValue
+from .env import EnvPrefix, EnvValue, SecureEnvValue
 from .model import SecureValue, WrappedValue
+from .streaming import YamlStream
 
 __all__ = [
     AppConfigBase,
@@ -9,9 +10,11 @@ __all__ = [
     AppConfigurationSource,
     AppConfigurationType,
     EnvConfig,
+    EnvPrefix,
     EnvValue,
     load_dataclass,
     SecureEnvValue,
     SecureValue,
     WrappedValue,
+    YamlStream,
 ]
@@ -1,16 +1,30 @@
+import os
+from collections import ChainMap
+from contextlib import ExitStack
+from copy import copy, deepcopy
 from dataclasses import MISSING, Field, dataclass, fields, is_dataclass
+from functools import cache
 from pathlib import Path
-from typing import (Any, Iterable, Optional, Self, Type, TypeVar, Union,
-                    get_args, get_origin)
+from typing import (Any, Iterable, Mapping, Optional, Self, Type, TypeVar,
+                    Union, get_args, get_origin)
 
 from config import Configuration, ConfigurationSet
 from config import config as config_magic
 from config import config_from_dict
-from dotenv import load_dotenv
+from dotenv import dotenv_values
 
-from praline.config.env import EnvValue, SecureEnvValue
+from praline.config.context import get_environ, use_environ
+from praline.config.dump import dump_dataclass
+from praline.config.env import EnvPrefix, EnvValue, SecureEnvValue
+from praline.config.fingerprint import clear_fingerprint, diff, fingerprint
 from praline.config.helpers import if_any
 from praline.config.logging import debug, trace, warning
+from praline.config.model import SecureValue
+from praline.config.query import PathQuery, compile_query
+from praline.config.secrets import (PrefetchedSecretProvider, SecretProvider,
+                                    use_secret_provider)
+from praline.config.streaming import YamlStream
+from praline.config.view import ConfigView
 
 
 def get_field_factory(f: Field):
@@ -48,7 +62,10 @@ def load_element(factory, value) -> Any:
     else:
         try:
             trace(f"{factory} is a primitive or callable.")
-            if isinstance(value, (Configuration, dict, list)):
+            if isinstance(value, ConfigView):
+                # Views are only for binding; the factory gets its own dicts.
+                value = value.as_dict()
+            if isinstance(value, (Configuration, Mapping, list)):
                 # If factory isn't a type we know how to handle,
                 #  assume that a dict/Configuration means we should
                 #  try loading it as a kwargs dict.
@@ -64,16 +81,20 @@ def load_element(factory, value) -> Any:
     return _value
 
 
-def load_complex(factory: callable, value: Configuration|dict) -> Any:
+def load_complex(factory: callable, value: Configuration|Mapping) -> Any:
     r"""
     Best-effort attempt to load a non-dataclass object.
+
+    The factory always receives plain dicts, never ConfigViews.
     """
     result = None
     try:
-        parameters: Optional[dict] = None
+        parameters: Optional[Mapping] = None
         if isinstance(value, Configuration):
+            parameters = ConfigView.from_configuration(value).as_dict()
+        elif isinstance(value, ConfigView):
             parameters = value.as_dict()
-        elif isinstance(value, dict):
+        elif isinstance(value, Mapping):
             parameters = value
         result = factory(**parameters)
     except Exception as ex:
@@ -118,18 +139,23 @@ def load_list(element_type: _ET, value: list[Any]) -> list[Any]:
 _DC = TypeVar("_DC", bound=dataclass)
 
 
-def load_dataclass(dc: Type[_DC], config: Configuration) -> _DC:
+def load_dataclass(dc: Type[_DC], config: Configuration | Mapping) -> _DC:
     r"""
     Inspects the fields of a dataclass and attempts to instantiate it from the
     Configuration object passed in.
 
     Walk the list of fields in `dc` and prepare a properties dict to call the
     constructor.
+
+    A Configuration is converted to a ConfigView once here, so nested lookups
+    below this point don't copy their subtrees.
     """
     if config is None:
         debug("config is None")
         return None
     trace(f"dc is type: {dc}")
+    if isinstance(config, Configuration):
+        config = ConfigView.from_configuration(config)
 
     properties = dict()
     for f in fields(dc):
@@ -147,7 +173,153 @@ def load_dataclass(dc: Type[_DC], config: Configuration) -> _DC:
     return result
 
 
-AppConfigurationType = Union[Configuration, Path, dict, str]
+def _expand_dotted(overrides: Mapping[str, Any]) -> dict[str, Any]:
+    r"""
+    Turn dotted keys, as accepted by `load` overrides, into nested dicts.
+    """
+    result: dict[str, Any] = dict()
+    for key, value in overrides.items():
+        head, _, rest = str(key).partition(".")
+        if rest:
+            value = {rest: value}
+        if isinstance(value, Mapping):
+            value = _expand_dotted(value)
+            if isinstance(result.get(head), dict):
+                value = _merge_mappings(result[head], value)
+        result[head] = value
+    return result
+
+
+def _merge_mappings(current: Mapping, override: Mapping) -> dict[str, Any]:
+    r"""
+    Merge `override` into a copy of `current` key by key, as a ConfigurationSet
+    would. Only the dicts along an overridden path are copied.
+    """
+    result = dict(current)
+    for key, item in override.items():
+        if isinstance(item, Mapping) and isinstance(result.get(key), Mapping):
+            result[key] = _merge_mappings(result[key], item)
+        else:
+            result[key] = deepcopy(item)
+    return result
+
+
+def overlay_element(factory, current: Any, override: Any) -> Any:
+    r"""
+    Apply an override to an already loaded value. Mappings are merged into
+    dataclasses and typed dicts the way a ConfigurationSet merges them, sharing
+    every untouched member; anything else is loaded from the override alone.
+    """
+    if isinstance(override, Mapping) and current is not None:
+        if is_dataclass(factory) and is_dataclass(current):
+            return overlay_dataclass(current, override)
+        if get_origin(factory) is dict and isinstance(current, dict):
+            element_factory = get_args(factory)[1]
+            result = dict(current)
+            for key, item in override.items():
+                result[key] = overlay_element(element_factory, current.get(key), item)
+            return result
+        if factory is dict and isinstance(current, dict):
+            return _merge_mappings(current, override)
+    return load_element(factory, override)
+
+
+def overlay_dataclass(instance: _DC, overrides: Mapping[str, Any]) -> _DC:
+    r"""
+    Derive a new instance from a loaded one by applying `overrides`, nested or
+    dotted. Only the fields on an overridden path are rebound; every other
+    field, at every level, is the same object as in `instance`. The cost is
+    proportional to the overrides rather than the size of the config.
+
+    The result is a shallow copy with the changed fields set directly, so
+    `__post_init__`/`init` don't run again and singletons stay bound to the
+    loaded instance.
+    """
+    field_map: dict[str, Field] = {f.name: f for f in fields(instance)}
+    changes: dict[str, Any] = dict()
+    for name, value in _expand_dotted(overrides).items():
+        f: Field | None = field_map.get(name)
+        if f is None:
+            trace(f"{name} is not a field of {type(instance)}.")
+            continue
+        changes[name] = overlay_element(get_field_factory(f), getattr(instance, name), value)
+    result = copy(instance)
+    clear_fingerprint(result, deep=False)
+    for name, value in changes.items():
+        # object.__setattr__ so frozen dataclasses can be derived too.
+        object.__setattr__(result, name, value)
+    return result
+
+
+def _is_secret_factory(factory) -> bool:
+    owner = getattr(factory, "__self__", None)
+    return isinstance(owner, type) and issubclass(owner, SecureValue)
+
+
+def _type_holds_secrets(factory, seen: set[type]) -> bool:
+    if _is_secret_factory(factory):
+        return True
+    if is_dataclass(factory):
+        if factory in seen:
+            return False
+        seen.add(factory)
+        return any(_type_holds_secrets(get_field_factory(f), seen) for f in fields(factory))
+    if get_origin(factory) in (dict, list):
+        return any(_type_holds_secrets(arg, seen) for arg in get_args(factory))
+    return False
+
+
+@cache
+def _may_hold_secrets(factory) -> bool:
+    r"""
+    Whether a value loaded with `factory` can contain a SecureValue, judged
+    from the types alone so values that can't are never walked.
+    """
+    return _type_holds_secrets(factory, set())
+
+
+def _collect_element_secret_names(factory, value) -> set[str]:
+    if value is None or not _may_hold_secrets(factory):
+        return set()
+    if is_dataclass(factory):
+        return collect_secret_names(factory, value)
+    if get_origin(factory) is dict:
+        element_factory = get_args(factory)[1]
+        items = value.values()
+    elif get_origin(factory) is list:
+        element_factory = get_args(factory)[0]
+        items = value
+    elif _is_secret_factory(factory):
+        return {str(value)}
+    else:
+        return set()
+
+    names: set[str] = set()
+    for item in items:
+        names |= _collect_element_secret_names(element_factory, item)
+    return names
+
+
+def collect_secret_names(dc: Type[_DC], config: Configuration | Mapping) -> set[str]:
+    r"""
+    Walk the fields of a dataclass alongside the Configuration it will be
+    loaded from and gather the names of every secret a SecureValue factory,
+    such as `SecureEnvValue.for_var`, will look up. Lets all of a config's
+    secrets be fetched in one batch before binding.
+    """
+    names: set[str] = set()
+    if config is None:
+        return names
+    for f in fields(dc):
+        try:
+            value: Any = config[f.name]
+        except KeyError:
+            continue
+        names |= _collect_element_secret_names(get_field_factory(f), value)
+    return names
+
+
+AppConfigurationType = Union[Configuration, Path, EnvPrefix, YamlStream, dict, str]
 AppConfigurationSource: Type = Union[
     Iterable[AppConfigurationType],
     AppConfigurationType,
@@ -172,6 +344,12 @@ def merge_configs(
         case cs if isinstance(cs, dict):
             trace("config_source is a dict.")
             _configs_clean.append(config_from_dict(cs))
+        case cs if isinstance(cs, EnvPrefix):
+            trace("config_source is an EnvPrefix.")
+            _configs_clean.append(cs.configuration())
+        case cs if isinstance(cs, YamlStream):
+            trace("config_source is a YamlStream.")
+            _configs_clean.append(cs.configuration())
         case cs if isinstance(cs, str) | isinstance(cs, Path):
             trace("config_source is a Path or str.")
             _configs_clean.append(config_magic(str(cs)))
@@ -208,6 +386,11 @@ class AppConfigCore:
             dotenv: Iterable[str | Path] = None,
             config: AppConfigurationSource | None = None,
             overrides: dict[str, Any] = None,
+            secret_provider: SecretProvider | None = None,
+            environ: Mapping[str, str] | None = None,
+            export_dotenv: bool = False,
+            env_prefix: str | None = None,
+            env_separator: str = "__",
     ) -> Self:
         r"""
         Convenience method to ergonomically instantiate an AppConfig class or
@@ -216,14 +399,37 @@ class AppConfigCore:
         This handles loading .env files, merging various Configuration sources,
         applies "overrides", such as may be sourced from command line
         parameters.
+
+        When `secret_provider` is given, every secret the config refers to is
+        fetched from it in a single batch and SecureEnvValue fields resolve
+        through it instead of the environment.
+
+        Loading is reentrant: EnvValue fields bind from `environ` (default
+        `os.environ`) with the dotenv files layered underneath for this call
+        only. Set `export_dotenv` to also add the dotenv values to
+        `os.environ`, which is shared by every thread.
+
+        With `env_prefix`, every environment variable starting with it is bound
+        onto nested fields, e.g. `APP_DATABASE__HOST` -> `database.host` for
+        `env_prefix="APP_"`. That layer sits above `config` and below
+        `overrides`. See `EnvPrefix`.
         """
+        environ = get_environ() if environ is None else environ
         if dotenv:
+            layers: list[Mapping[str, str]] = [environ]
             for env_source in dotenv:
                 if isinstance(env_source, Path):
                     with env_source.open("r") as istream:
-                        load_dotenv(stream=istream)
+                        values = dotenv_values(stream=istream)
                 else:
-                    load_dotenv(dotenv_path=env_source)
+                    values = dotenv_values(dotenv_path=env_source)
+                values = {key: value for key, value in values.items() if value is not None}
+                if export_dotenv:
+                    for key, value in values.items():
+                        os.environ.setdefault(key, value)
+                layers.append(values)
+            # Like load_dotenv, earlier sources win over later ones.
+            environ = ChainMap(*layers)
 
         if (
             config is None
@@ -234,20 +440,69 @@ class AppConfigCore:
         ) and (
             overrides is None
             or len(overrides) == 0
-        ):
+        ) and env_prefix is None:
             trace("No config was provided; calling empty constructor.")
             return cls()
 
-        _config: Configuration = merge_configs(
-            [
-                config_from_dict(overrides or {}),
-                config
-            ]
-        )
-
-        instance: Self = load_dataclass(cls, config=_config)
+        with ExitStack() as stack:
+            stack.enter_context(use_environ(environ))
+            layers: list[AppConfigurationSource] = [config_from_dict(overrides or {})]
+            if env_prefix is not None:
+                layers.append(EnvPrefix(env_prefix, separator=env_separator, target=cls))
+            layers.append(config)
+            _config: ConfigView = ConfigView.from_configuration(merge_configs(layers))
+
+            if secret_provider is not None:
+                stack.enter_context(use_secret_provider(PrefetchedSecretProvider(
+                    secret_provider,
+                    collect_secret_names(cls, _config),
+                )))
+            instance: Self = load_dataclass(cls, config=_config)
         return instance
 
+    @classmethod
+    def compile_query(cls, path: str) -> PathQuery:
+        r"""
+        Compile a dotted path, e.g. `services.api.routes[0].timeout` or
+        `services.*.port`, into a reusable accessor. Cached per class and path.
+        """
+        return compile_query(cls, path)
+
+    def query(self, path: str, default: Any = None) -> Any:
+        r"""
+        Evaluate a path against this config. See `compile_query`.
+        """
+        return compile_query(type(self), path)(self, default)
+
+    def derive(self, overrides: dict[str, Any]) -> Self:
+        r"""
+        Copy-on-write variant of this config with `overrides` applied, for
+        cases like per-tenant configs over a shared base. Untouched subtrees
+        are shared with this instance, so treat both as read-only.
+        """
+        return overlay_dataclass(self, overrides)
+
+    def fingerprint(self) -> bytes:
+        r"""
+        Content hash of this config, cached per subtree. Equal configs have
+        equal fingerprints.
+        """
+        return fingerprint(self)
+
+    def diff(self, other: Self) -> list[str]:
+        r"""
+        Paths that differ between this config and `other`, e.g. to decide which
+        components to restart after a reload.
+        """
+        return diff(self, other)
+
+    def dump(self, mask_secure: bool = True) -> dict[str, Any]:
+        r"""
+        Plain data for this config that `load` accepts back. See
+        `praline.config.dump` for JSON and binary forms.
+        """
+        return dump_dataclass(self, mask_secure=mask_secure)
+
 
 @dataclass
 class AppConfigBase(AppConfigCore, EnvConfig):
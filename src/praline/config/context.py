@@ -0,0 +1,32 @@
+r"""
+Per-call state for the load pipeline, kept in context variables so concurrent
+loads on different threads or tasks don't share it.
+"""
+import os
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Mapping
+
+_environ: ContextVar[Mapping[str, str] | None] = ContextVar("praline_environ", default=None)
+
+
+def get_environ() -> Mapping[str, str]:
+    r"""
+    The environment EnvValue fields bind from: `os.environ` unless a load has
+    layered its own on top.
+    """
+    environ = _environ.get()
+    return os.environ if environ is None else environ
+
+
+@contextmanager
+def use_environ(environ: Mapping[str, str]) -> Iterator[Mapping[str, str]]:
+    r"""
+    Bind environment lookups to `environ` for the current thread or task until
+    the block exits. `os.environ` is left untouched.
+    """
+    token = _environ.set(environ)
+    try:
+        yield environ
+    finally:
+        _environ.reset(token)
@@ -0,0 +1,148 @@
+r"""
+Compiled dumpers, the counterpart of `load_dataclass`. Turn a loaded config
+back into plain data that `AppConfigCore.load(config=...)` accepts.
+"""
+import json
+import marshal
+from dataclasses import fields, is_dataclass
+from datetime import date, datetime, time
+from functools import cache
+from typing import Any, Callable, get_args, get_origin
+
+from praline.config.env import EnvValue
+from praline.config.model import SecureValue, WrappedValue
+
+Dumper = Callable[[Any], Any]
+
+_PLAIN_TYPES = (str, int, float, bool, type(None))
+
+
+def _dump_wrapped(value: WrappedValue, mask_secure: bool) -> Any:
+    if isinstance(value, EnvValue) and value.name is not None:
+        # The config entry for an EnvValue is the variable name, which both
+        #  round-trips and keeps the resolved value out of the output.
+        return value.name
+    if mask_secure and isinstance(value, SecureValue):
+        return value.mask_str
+    return value.value()
+
+
+def _normalize_leaf(value: Any) -> Any:
+    r"""
+    Reduce a leaf with no JSON representation to a string its type can be
+    reconstructed from.
+    """
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    return str(value)
+
+
+def _dump_any(value: Any, mask_secure: bool) -> Any:
+    r"""
+    Fallback used where the field type doesn't tell us enough; dispatches on the
+    runtime type instead.
+    """
+    if isinstance(value, _PLAIN_TYPES):
+        return value
+    if is_dataclass(value):
+        return get_dumper(type(value), mask_secure)(value)
+    if isinstance(value, WrappedValue):
+        return _dump_wrapped(value, mask_secure)
+    if isinstance(value, dict):
+        return {key: _dump_any(item, mask_secure) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_dump_any(item, mask_secure) for item in value]
+    if hasattr(value, "__dict__") and not isinstance(value, type):
+        # Mirrors load_complex, which passes a mapping as constructor kwargs.
+        return {
+            key: _dump_any(item, mask_secure)
+            for key, item in vars(value).items()
+            if not key.startswith("_")
+        }
+    return _normalize_leaf(value)
+
+
+def _compile_dataclass(dc: type, mask_secure: bool) -> Dumper:
+    field_dumpers: list[tuple[str, Dumper | None]] = []
+    for f in fields(dc):
+        factory = f.default_factory if callable(f.default_factory) else f.type
+        field_dumpers.append((f.name, _field_dumper(factory, mask_secure)))
+    field_dumpers: tuple[tuple[str, Dumper | None], ...] = tuple(field_dumpers)
+
+    def dump(instance: Any) -> dict[str, Any]:
+        result = dict()
+        for name, dumper in field_dumpers:
+            value = getattr(instance, name)
+            if value is None or dumper is None:
+                result[name] = value
+            else:
+                result[name] = dumper(value)
+        return result
+    return dump
+
+
+def _field_dumper(factory: Any, mask_secure: bool) -> Dumper | None:
+    r"""
+    Choose a dumper from the declared factory, the same way `load_element`
+    chooses a loader. None means the value is already plain.
+    """
+    if factory in (str, int, float, bool):
+        return None
+    if is_dataclass(factory):
+        # Resolved on first call so self-referencing dataclasses compile.
+        return lambda value: get_dumper(type(value), mask_secure)(value)
+    if get_origin(factory) is dict:
+        element_dumper = _field_dumper(get_args(factory)[1], mask_secure)
+        if element_dumper is None:
+            return dict
+        return lambda value: {
+            key: None if item is None else element_dumper(item)
+            for key, item in value.items()
+        }
+    if get_origin(factory) is list:
+        element_dumper = _field_dumper(get_args(factory)[0], mask_secure)
+        if element_dumper is None:
+            return list
+        return lambda value: [None if item is None else element_dumper(item) for item in value]
+    return lambda value: _dump_any(value, mask_secure)
+
+
+@cache
+def get_dumper(dc: type, mask_secure: bool = True) -> Dumper:
+    r"""
+    Compile, once per dataclass and options, a function that converts an
+    instance to plain dicts and lists in a single pass.
+
+    `mask_secure` replaces SecureValue contents with their mask; EnvValue
+    fields are always written as their variable name. Any other leaf without a
+    JSON form (datetime, Decimal, UUID...) becomes a string its type accepts.
+    """
+    return _compile_dataclass(dc, mask_secure)
+
+
+def dump_dataclass(instance: Any, mask_secure: bool = True) -> dict[str, Any]:
+    r"""
+    Convert a loaded config to plain data. Loading the result with
+    `load_dataclass` gives back an equal config, except for SecureValue
+    fields when they are masked.
+    """
+    return get_dumper(type(instance), mask_secure)(instance)
+
+
+def dumps_json(instance: Any, mask_secure: bool = True, **kwargs) -> str:
+    return json.dumps(get_dumper(type(instance), mask_secure)(instance), **kwargs)
+
+
+def dumps_binary(instance: Any, mask_secure: bool = True) -> bytes:
+    r"""
+    Compact binary form for caches and worker processes. Uses `marshal`, so
+    only read it back with the same Python version.
+    """
+    return marshal.dumps(get_dumper(type(instance), mask_secure)(instance))
+
+
+def loads_binary(data: bytes) -> dict[str, Any]:
+    r"""
+    Read the output of `dumps_binary` back into plain data ready to load.
+    """
+    return marshal.loads(data)
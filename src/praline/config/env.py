@@ -1,22 +1,148 @@
-import os
-from typing import Self
+from dataclasses import fields, is_dataclass
+from typing import Any, Mapping, Self, get_args, get_origin
 
+from config import Configuration, config_from_dict
+from config.helpers import as_bool
+
+from praline.config.context import get_environ
+from praline.config.logging import trace, warning
 from praline.config.model import SecureValue, WrappedValue
+from praline.config.secrets import resolve_secret
 
 
 class EnvValue(WrappedValue):
     r"""
     Convenience class to bind values from the environment into
-    a simple WrappedValue instance.
+    a simple WrappedValue instance. The variable name is kept so the config
+    entry can be written back out.
     """
+    def __init__(self, value: str, name: str | None = None):
+        super().__init__(value)
+        self.name: str | None = name
+
     @classmethod
     def for_var(cls, name: str) -> Self:
-        return cls(value=os.environ.get(name))
+        return cls(value=get_environ().get(name), name=name)
 
 
 class SecureEnvValue(EnvValue, SecureValue):
     r"""
     Simple confluence of an EnvValue that needs to be wrapped securely for cases
     such as passwords that are "passed" to a program via environment variables.
+
+    Values are resolved through the active SecretProvider when one is in use,
+    see `praline.config.secrets.use_secret_provider`.
+    """
+    @classmethod
+    def for_var(cls, name: str) -> Self:
+        return cls(value=resolve_secret(name), name=name)
+
+
+def _indexes(node: dict[str, Any]) -> list[str] | None:
+    r"""
+    The keys of `node` in index order if they are exactly `0..n-1`.
     """
-    ...
+    if not node or not all(key.isdigit() for key in node):
+        return None
+    keys = sorted(node, key=int)
+    if [int(key) for key in keys] != list(range(len(keys))):
+        return None
+    return keys
+
+
+def _bind_names(node: Any, target: Any) -> Any:
+    r"""
+    Match lower-cased trie keys to the field names of `target` without regard
+    to case, dropping keys the target has no field for. Nodes become lists when
+    `target` is a list, or when there is no target and the keys are the
+    indexes `0..n-1`; a list target with any other keys is ignored. Strings
+    for bool targets are parsed, since `bool("false")` is True.
+    """
+    if not isinstance(node, dict):
+        if isinstance(node, str) and target is bool:
+            try:
+                return as_bool(node)
+            except ValueError:
+                warning(f"Ignoring environment value {node!r}; expected a boolean.")
+                return None
+        return node
+
+    if target is list or get_origin(target) is list:
+        keys = _indexes(node)
+        if keys is None:
+            warning(f"Ignoring environment keys {sorted(node)}; a list needs indexes 0..n-1.")
+            return None
+        element_type = next(iter(get_args(target)), None)
+        return [_bind_names(node[key], element_type) for key in keys]
+
+    if is_dataclass(target):
+        result: dict[str, Any] = dict()
+        by_name = {f.name.lower(): f for f in fields(target)}
+        for key, child in node.items():
+            f = by_name.get(key)
+            if f is None:
+                trace(f"{target.__name__} has no field for environment key {key}.")
+                continue
+            factory = f.default_factory if callable(f.default_factory) else f.type
+            element = _bind_names(child, factory)
+            if element is not None:
+                result[f.name] = element
+        return result
+
+    if get_origin(target) is dict:
+        element_type = get_args(target)[1]
+    else:
+        keys = _indexes(node)
+        if target is None and keys is not None:
+            return [_bind_names(node[key], None) for key in keys]
+        element_type = None
+    result = {key: _bind_names(child, element_type) for key, child in node.items()}
+    return {key: element for key, element in result.items() if element is not None}
+
+
+class EnvPrefix:
+    r"""
+    Configuration source that binds every environment variable starting with
+    `prefix` onto nested fields, with `separator` marking each level, e.g.
+    `APP_DATABASE__HOST` -> `database.host` and `APP_HOSTS__0` -> `hosts[0]`.
+
+    The environment is read in a single pass into a trie of lower-cased keys.
+    With a `target` class, keys are matched to its field names regardless of
+    case and keys with no matching field are ignored. List fields need every
+    index from 0 with no gaps; digit keys under dict fields stay keys.
+    """
+    def __init__(
+            self,
+            prefix: str,
+            separator: str = "__",
+            target: type | None = None,
+            environ: Mapping[str, str] | None = None,
+    ):
+        self.prefix = prefix
+        self.separator = separator
+        self.target = target
+        self.environ = environ
+
+    def trie(self) -> dict[str, Any]:
+        environ = get_environ() if self.environ is None else self.environ
+        prefix = self.prefix.upper()
+        root: dict[str, Any] = dict()
+        for name, value in environ.items():
+            if not name.upper().startswith(prefix):
+                continue
+            parts = name[len(prefix):].lower().split(self.separator)
+            if not all(parts):
+                continue
+            node = root
+            for part in parts[:-1]:
+                child = node.get(part)
+                if not isinstance(child, dict):
+                    child = node[part] = dict()
+                node = child
+            if not isinstance(node.get(parts[-1]), dict):
+                # A nested variable wins over a scalar for the same path.
+                node[parts[-1]] = value
+        return root
+
+    def configuration(self) -> Configuration:
+        return config_from_dict(_bind_names(self.trie(), self.target))
@@ -0,0 +1,173 @@
+r"""
+Merkle-style content hashes for loaded configs.
+
+Each dataclass instance caches its own hash the first time it is asked for, and
+a parent's hash is built from its children's, so once computed, comparing two
+configs is a single digest comparison and `diff` only descends where digests
+differ. Subtrees shared between configs, such as those from
+`AppConfigCore.derive`, share their cached hashes too.
+
+Other objects are hashed by their `__dict__` and `__slots__`; one with neither
+only matches itself, since its repr can't be trusted to reflect its value.
+
+SecureValue contents are hashed with a random key generated per process, so a
+fingerprint that is logged or exported can't be used to test guesses of a
+secret offline. Fingerprints are therefore only comparable within the process
+that computed them; don't persist them.
+
+Loaded configs are treated as read-only; mutating a field after its hash has
+been computed leaves a stale hash. Call `clear_fingerprint` if you must.
+"""
+import os
+from dataclasses import fields, is_dataclass
+from datetime import date, time, timedelta
+from decimal import Decimal
+from enum import Enum
+from fractions import Fraction
+from hashlib import blake2b
+from pathlib import PurePath
+from typing import Any, Mapping
+from uuid import UUID
+
+from praline.config.model import SecureValue, WrappedValue
+
+_CACHE_ATTR = "__praline_fingerprint__"
+_DIGEST_SIZE = 16
+_SECRET_KEY = os.urandom(blake2b.MAX_KEY_SIZE)
+# Types whose repr is determined by their value, so it can be hashed as is.
+_REPR_TYPES = (
+    str, bytes, int, float, complex, bool, type(None), Decimal, Fraction,
+    date, time, timedelta, UUID, PurePath, Enum, range, type,
+)
+
+
+def _digest(*parts: bytes, key: bytes = b"") -> bytes:
+    h = blake2b(digest_size=_DIGEST_SIZE, key=key)
+    for part in parts:
+        h.update(len(part).to_bytes(8, "little"))
+        h.update(part)
+    return h.digest()
+
+
+def _type_tag(value: Any) -> bytes:
+    cls = type(value)
+    return f"{cls.__module__}.{cls.__qualname__}".encode()
+
+
+def _attributes(value: Any) -> dict[str, Any] | None:
+    r"""
+    Instance state from `__dict__` and `__slots__`, or None if there is
+    neither.
+    """
+    result: dict[str, Any] | None = None
+    for cls in type(value).__mro__:
+        slots = cls.__dict__.get("__slots__", ())
+        for name in (slots,) if isinstance(slots, str) else slots:
+            if name in ("__dict__", "__weakref__"):
+                continue
+            result = result if result is not None else dict()
+            try:
+                result[name] = getattr(value, name)
+            except AttributeError:
+                pass
+    if hasattr(value, "__dict__"):
+        result = {**vars(value), **(result or {})}
+    return result
+
+
+def _compute(value: Any) -> bytes:
+    if is_dataclass(value) and not isinstance(value, type):
+        return _digest(
+            _type_tag(value),
+            *(_digest(f.name.encode(), fingerprint(getattr(value, f.name))) for f in fields(value)),
+        )
+    if isinstance(value, SecureValue):
+        return _digest(_type_tag(value), fingerprint(value.value()), key=_SECRET_KEY)
+    if isinstance(value, WrappedValue):
+        return _digest(_type_tag(value), fingerprint(value.value()))
+    if isinstance(value, Mapping):
+        # Sorted so that, like dict equality, insertion order doesn't matter.
+        return _digest(b"dict", *sorted(
+            _digest(fingerprint(key), fingerprint(item)) for key, item in value.items()
+        ))
+    if isinstance(value, (list, tuple)):
+        return _digest(_type_tag(value), *(fingerprint(item) for item in value))
+    if isinstance(value, (set, frozenset)):
+        return _digest(_type_tag(value), *sorted(fingerprint(item) for item in value))
+    if isinstance(value, _REPR_TYPES):
+        return _digest(_type_tag(value), repr(value).encode())
+    attributes = _attributes(value)
+    if attributes is not None:
+        return _digest(_type_tag(value), fingerprint(attributes))
+    # Nothing to hash the content by; only the same object is equal to itself.
+    return _digest(_type_tag(value), b"id", id(value).to_bytes(8, "little"))
+
+
+def fingerprint(value: Any) -> bytes:
+    r"""
+    Content hash of a config value. Cached on dataclass instances.
+    """
+    if is_dataclass(value) and not isinstance(value, type):
+        cached = getattr(value, _CACHE_ATTR, None)
+        if cached is not None:
+            return cached
+        result = _compute(value)
+        try:
+            # object.__setattr__ so frozen dataclasses can cache too.
+            object.__setattr__(value, _CACHE_ATTR, result)
+        except AttributeError:
+            pass
+        return result
+    return _compute(value)
+
+
+def clear_fingerprint(value: Any, deep: bool = True) -> None:
+    r"""
+    Drop cached hashes for a dataclass instance and, when `deep`, every
+    dataclass below it.
+    """
+    if is_dataclass(value) and not isinstance(value, type):
+        getattr(value, "__dict__", {}).pop(_CACHE_ATTR, None)
+        if deep:
+            for f in fields(value):
+                clear_fingerprint(getattr(value, f.name))
+    elif deep and isinstance(value, Mapping):
+        for item in value.values():
+            clear_fingerprint(item)
+    elif deep and isinstance(value, (list, tuple)):
+        for item in value:
+            clear_fingerprint(item)
+
+
+def _join(path: str, name: str) -> str:
+    return f"{path}.{name}" if path else name
+
+
+def diff(old: Any, new: Any, path: str = "") -> list[str]:
+    r"""
+    Paths at which two configs differ, using the same path syntax as
+    `praline.config.query`. Only subtrees whose fingerprints differ are
+    walked. Added or removed dict keys are reported as their own path.
+    """
+    if old is new or fingerprint(old) == fingerprint(new):
+        return []
+    if is_dataclass(old) and type(old) is type(new):
+        result: list[str] = []
+        for f in fields(old):
+            result.extend(diff(getattr(old, f.name), getattr(new, f.name), _join(path, f.name)))
+        return result
+    if isinstance(old, Mapping) and isinstance(new, Mapping):
+        result = []
+        for key in list(old) + [key for key in new if key not in old]:
+            key_path = _join(path, str(key)) if "." not in str(key) else f"{path}[{str(key)!r}]"
+            if key not in old or key not in new:
+                result.append(key_path)
+            else:
+                result.extend(diff(old[key], new[key], key_path))
+        return result
+    if isinstance(old, list) and isinstance(new, list) and len(old) == len(new):
+        result = []
+        for index, (old_item, new_item) in enumerate(zip(old, new)):
+            result.extend(diff(old_item, new_item, f"{path}[{index}]"))
+        return result
+    return [path]
@@ -1,4 +1,8 @@
 import csv
+import io
+import locale
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
 from typing import Any, Callable, TypeVar
 
@@ -16,18 +20,134 @@ def nullif(value: _T, test: _T) -> _T | None:
     return value
 
 
-def csv_to_nested_dict(csv_file: Path, key_fields: list[str], key_delimiter: str = None) -> dict[str, dict[str, str]]:
+def _row_key(row: dict[str, Any], key_fields: list[str], key_delimiter: str) -> str:
+    key_values: list[str] = []
+    for key_field in key_fields:
+        key_values.append(row[key_field])
+    return key_delimiter.join(key_values)
+
+
+def _count_quotes(csv_file: Path, start: int, end: int) -> int:
+    with csv_file.open('rb') as file:
+        file.seek(start)
+        return file.read(end - start).count(b'"')
+
+
+def _record_boundary(csv_file: Path, offset: int, in_quotes: bool, block_size: int = 1 << 16) -> int:
+    r"""
+    Find the byte offset just past the first record terminator at or after
+    `offset`. Newlines inside a quoted field are skipped by tracking quote
+    parity from the known state at `offset`; doubled quotes cancel out.
+    """
+    with csv_file.open('rb') as file:
+        file.seek(offset)
+        position = offset
+        while block := file.read(block_size):
+            for index, byte in enumerate(block):
+                if byte == 0x22:  # '"'
+                    in_quotes = not in_quotes
+                elif byte == 0x0A and not in_quotes:  # '\n'
+                    return position + index + 1
+            position += len(block)
+    return position
+
+
+def _parse_chunk(
+        csv_file: Path,
+        start: int,
+        end: int,
+        field_names: list[str],
+        key_fields: list[str],
+        key_delimiter: str,
+) -> dict[str, dict[str, str]]:
+    with csv_file.open('rb') as file:
+        file.seek(start)
+        data = file.read(end - start)
+    text = io.TextIOWrapper(io.BytesIO(data), encoding=locale.getpreferredencoding(False), newline='')
+    nested_dict = {}
+    for row in csv.DictReader(text, fieldnames=field_names):
+        nested_dict[_row_key(row, key_fields, key_delimiter)] = row
+    return nested_dict
+
+
+def _csv_to_nested_dict_parallel(
+        csv_file: Path,
+        key_fields: list[str],
+        key_delimiter: str,
+        workers: int | None,
+        chunk_size: int,
+) -> dict[str, dict[str, str]]:
+    r"""
+    Split the file into byte ranges that end on record boundaries and parse
+    them in a process pool. Ranges are merged in file order so a later row still
+    replaces an earlier row with the same key.
+    """
+    size = csv_file.stat().st_size
+    header_end = _record_boundary(csv_file, 0, False)
+    with csv_file.open('r', newline='') as file:
+        field_names = next(csv.reader(file), [])
+
+    nominal = list(range(header_end, size, chunk_size)) + [size]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # Quote parity at each nominal offset tells us whether it falls inside a
+        #  quoted field, without a sequential scan of the whole file.
+        quote_counts = list(executor.map(
+            _count_quotes, repeat(csv_file), nominal[:-1], nominal[1:],
+        ))
+        in_quotes: list[bool] = []
+        total = 0
+        for count in quote_counts[:-1]:
+            total += count
+            in_quotes.append(total % 2 == 1)
+        inner = list(executor.map(_record_boundary, repeat(csv_file), nominal[1:-1], in_quotes))
+
+        boundaries = [header_end]
+        for boundary in inner + [size]:
+            # A record longer than chunk_size can swallow a nominal boundary.
+            if boundary > boundaries[-1]:
+                boundaries.append(boundary)
+
+        chunks = executor.map(
+            _parse_chunk,
+            repeat(csv_file),
+            boundaries[:-1],
+            boundaries[1:],
+            repeat(field_names),
+            repeat(key_fields),
+            repeat(key_delimiter),
+        )
+        nested_dict = {}
+        for chunk in chunks:
+            nested_dict.update(chunk)
+    return nested_dict
+
+
+def csv_to_nested_dict(
+        csv_file: Path,
+        key_fields: list[str],
+        key_delimiter: str = None,
+        workers: int = None,
+        chunk_size: int = 1 << 26,
+) -> dict[str, dict[str, str]]:
     r"""
     For the csv file passed in, generate a dictionary that is keyed by the column identified by key_field.
     The value for each entry in the dictionary will be a dictionary with the complete record for the given line.
+
+    Pass `workers` greater than 1 (or 0 for one per CPU) to parse files larger than `chunk_size` bytes in
+    parallel processes. Rows sharing a key resolve the same way in both modes: the last row wins. Parallel mode
+    assumes quotes only appear around fields, as in RFC 4180.
     """
 
     key_delimiter_ = "," if key_delimiter is None else key_delimiter
-    def row_key(current_row: dict[str, Any]) -> str:
-        key_values: list[str] = []
-        for key_field in key_fields:
-            key_values.append(current_row[key_field])
-        return key_delimiter_.join(key_values)
+
+    if workers is not None and workers != 1 and csv_file.stat().st_size > chunk_size:
+        return _csv_to_nested_dict_parallel(
+            csv_file,
+            key_fields,
+            key_delimiter_,
+            workers=workers or None,
+            chunk_size=chunk_size,
+        )
 
     nested_dict = {}
     with csv_file.open('r', newline='') as file:
@@ -35,7 +155,7 @@ def csv_to_nested_dict(csv_file: Path, key_fields: list[str], key_delimiter: str
         # field_names = reader.fieldnames
         for row in reader:
             # row_dict: dict[str, Any] = zip(field_names, row)
-            parent_key = row_key(current_row=row)
+            parent_key = _row_key(row, key_fields, key_delimiter_)
             nested_dict[parent_key] = row
 
     return nested_dict
@@ -1,17 +1,71 @@
 r"""
 Setup logging for the library.
+
+The module level functions dispatch to the active set of logging functions at
+call time, so overrides apply to every module regardless of import order.
+Process-wide defaults are changed with `enable_trace` and
+`override_logging_functions`; `logging_context` overrides them for the current
+thread or task only, which keeps concurrent loads from interfering.
 """
 import logging
 import sys
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Iterator, NamedTuple
 
 __logger = logging.getLogger(f"""praline-config.{sys.modules[__name__].__package__.split(".")[0]}""")
 
 
-def trace(*args, **kwargs): ...
-debug = __logger.debug
-info = __logger.info
-warning = __logger.warning
-error = __logger.error
+def _noop(*args, **kwargs): ...
+
+
+class LoggingFunctions(NamedTuple):
+    trace: Callable
+    debug: Callable
+    info: Callable
+    warning: Callable
+    error: Callable
+
+
+# Replaced wholesale, never mutated, so readers never see a partial update.
+_defaults = LoggingFunctions(
+    trace=_noop,
+    debug=__logger.debug,
+    info=__logger.info,
+    warning=__logger.warning,
+    error=__logger.error,
+)
+_defaults_lock = threading.Lock()
+_context: ContextVar[LoggingFunctions | None] = ContextVar("praline_logging", default=None)
+
+
+def _active() -> LoggingFunctions:
+    return _context.get() or _defaults
+
+
+def trace(*args, **kwargs):
+    _active().trace(*args, **kwargs)
+
+
+def debug(*args, **kwargs):
+    _active().debug(*args, **kwargs)
+
+
+def info(*args, **kwargs):
+    _active().info(*args, **kwargs)
+
+
+def warning(*args, **kwargs):
+    _active().warning(*args, **kwargs)
+
+
+def error(*args, **kwargs):
+    _active().error(*args, **kwargs)
+
+
+def _with_overrides(base: LoggingFunctions, **overrides) -> LoggingFunctions:
+    return base._replace(**{name: fn for name, fn in overrides.items() if fn is not None})
 
 
 def enable_trace():
@@ -19,8 +73,9 @@ def enable_trace():
     By default, trace logging is no-op.
     :return:
     """
-    global trace
-    trace = __logger.debug
+    global _defaults
+    with _defaults_lock:
+        _defaults = _defaults._replace(trace=__logger.debug)
 
 
 def override_logging_functions(
@@ -35,9 +90,40 @@ def override_logging_functions(
     functions to deeply customize logging, or to inject a
     different library to use instead of the built-in logging module.
     """
-    global trace, debug, info, warning, error
-    trace = trace_logger or trace
-    debug = debug_logger or debug
-    info = info_logger or info
-    warning = warning_logger or warning
-    error = error_logger or error
+    global _defaults
+    with _defaults_lock:
+        _defaults = _with_overrides(
+            _defaults,
+            trace=trace_logger,
+            debug=debug_logger,
+            info=info_logger,
+            warning=warning_logger,
+            error=error_logger,
+        )
+
+
+@contextmanager
+def logging_context(
+    trace_logger=None,
+    debug_logger=None,
+    info_logger=None,
+    warning_logger=None,
+    error_logger=None,
+) -> Iterator[LoggingFunctions]:
+    r"""
+    Like `override_logging_functions`, but only for the current thread or task
+    and only until the block exits.
+    """
+    functions = _with_overrides(
+        _active(),
+        trace=trace_logger,
+        debug=debug_logger,
+        info=info_logger,
+        warning=warning_logger,
+        error=error_logger,
+    )
+    token = _context.set(functions)
+    try:
+        yield functions
+    finally:
+        _context.reset(token)
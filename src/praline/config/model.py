@@ -1,6 +1,6 @@
 from abc import abstractmethod
 from dataclasses import dataclass
-from typing import Any, ClassVar, Self, Type
+from typing import Any, ClassVar, Iterable, Self, Type
 
 from praline.config.logging import warning
 
@@ -20,6 +20,13 @@ class HasReify:
         """
         return None
 
+    def reify_depends_on(self) -> Iterable[str]:
+        r"""
+        Paths, relative to the root config, of other HasReify entries that must
+        be reified before this one. e.g. `("database", "caches.primary")`
+        """
+        return ()
+
     @abstractmethod
     def reify(self) -> Any: ...
 
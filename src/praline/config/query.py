@@ -0,0 +1,167 @@
+r"""
+Compiled path queries over loaded configs.
+
+A path such as `services.api.routes[0].timeout` or `services.*.routes[*].timeout`
+is parsed and resolved against the field types of the root class once; the
+resulting PathQuery evaluates with plain attribute and item lookups.
+"""
+import re
+import types
+from dataclasses import fields, is_dataclass
+from functools import lru_cache
+from operator import attrgetter, itemgetter, methodcaller
+from typing import (Any, Callable, Iterable, Mapping, Union, get_args,
+                    get_origin)
+
+_TOKEN = re.compile(r"""\[\s*(?:"([^"]*)"|'([^']*)'|([^\]]*?))\s*\]|([^.\[\]]+)""")
+
+WILDCARD = "*"
+
+
+def parse_path(path: str) -> list[str]:
+    r"""
+    Split a path into segments. Dots separate names, `[...]` holds an index,
+    a quoted key (which may contain dots) or `*`.
+    """
+    segments: list[str] = []
+    position = 0
+    while position < len(path):
+        if path[position] == ".":
+            position += 1
+            continue
+        match = _TOKEN.match(path, position)
+        if match is None:
+            raise ValueError(f"Invalid path: {path!r} at {position}.")
+        segments.append(next(group for group in match.groups() if group is not None))
+        position = match.end()
+    if not segments:
+        raise ValueError("Path is empty.")
+    return segments
+
+
+def _generic_get(segment: str) -> Callable[[Any], Any]:
+    r"""
+    Lookup for values whose type wasn't known at compile time.
+    """
+    def get(value: Any) -> Any:
+        if isinstance(value, Mapping):
+            return value[segment]
+        if isinstance(value, (list, tuple)):
+            return value[int(segment)]
+        return getattr(value, segment)
+    return get
+
+
+def _generic_fanout(value: Any) -> Iterable[Any]:
+    if isinstance(value, Mapping):
+        return value.values()
+    if isinstance(value, (list, tuple)):
+        return value
+    if is_dataclass(value):
+        return [getattr(value, f.name) for f in fields(value)]
+    raise TypeError(f"Cannot expand {type(value)} with '*'.")
+
+
+def _field_type(dc: type, name: str) -> Any:
+    for f in fields(dc):
+        if f.name == name:
+            return f.default_factory if callable(f.default_factory) else f.type
+    raise ValueError(f"{dc.__name__} has no field {name!r}.")
+
+
+def _compile_step(current: Any, segment: str) -> tuple[bool, Callable, Any]:
+    r"""
+    Returns `(fans_out, function, next_type)` for one segment, using the static
+    type where there is one.
+    """
+    if get_origin(current) in (Union, types.UnionType):
+        # Optional[X] / X | None behaves as X; None values end the walk anyway.
+        args = [arg for arg in get_args(current) if arg is not type(None)]
+        current = args[0] if len(args) == 1 else None
+    origin = get_origin(current)
+    if segment == WILDCARD:
+        if origin is dict:
+            return True, methodcaller("values"), get_args(current)[1]
+        if origin is list:
+            return True, iter, get_args(current)[0]
+        return True, _generic_fanout, None
+    if is_dataclass(current):
+        return False, attrgetter(segment), _field_type(current, segment)
+    if origin is dict:
+        return False, itemgetter(segment), get_args(current)[1]
+    if origin is list:
+        try:
+            return False, itemgetter(int(segment)), get_args(current)[0]
+        except ValueError:
+            raise ValueError(f"{segment!r} is not a list index.") from None
+    return False, _generic_get(segment), None
+
+
+_MISSING = (AttributeError, IndexError, KeyError, TypeError)
+
+
+class PathQuery:
+    r"""
+    A compiled path. Call it with an instance of the root class; missing
+    values along the way give `default`. Paths containing `*` return a list of
+    every match.
+    """
+    def __init__(self, root: type, path: str):
+        self.root = root
+        self.path = path
+        self._steps: list[tuple[bool, Callable]] = []
+        current: Any = root
+        for segment in parse_path(path):
+            fans_out, fn, current = _compile_step(current, segment)
+            self._steps.append((fans_out, fn))
+        self.wildcard: bool = any(fans_out for fans_out, _ in self._steps)
+        self._getters: tuple[Callable, ...] = tuple(fn for _, fn in self._steps)
+
+    def _collect(self, value: Any, start: int, out: list) -> None:
+        for index in range(start, len(self._steps)):
+            if value is None:
+                return
+            fans_out, fn = self._steps[index]
+            if fans_out:
+                try:
+                    items = fn(value)
+                except _MISSING:
+                    return
+                for item in items:
+                    self._collect(item, index + 1, out)
+                return
+            try:
+                value = fn(value)
+            except _MISSING:
+                return
+        out.append(value)
+
+    def __call__(self, instance: Any, default: Any = None) -> Any:
+        if self.wildcard:
+            out: list = []
+            self._collect(instance, 0, out)
+            return out
+        value = instance
+        try:
+            for getter in self._getters:
+                value = getter(value)
+        except _MISSING:
+            return default
+        return default if value is None else value
+
+    def many(self, instances: Iterable[Any], default: Any = None) -> list[Any]:
+        r"""
+        Evaluate against many instances, e.g. one config per tenant.
+        """
+        return [self(instance, default) for instance in instances]
+
+    def __repr__(self) -> str:
+        return f"<PathQuery {self.root.__name__}: {self.path}>"
+
+
+@lru_cache(maxsize=4096)
+def compile_query(root: type, path: str) -> PathQuery:
+    r"""
+    Compile `path` against `root`, caching per class and path.
+    """
+    return PathQuery(root, path)
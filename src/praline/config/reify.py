@@ -0,0 +1,519 @@
+r"""
+Caching and pooling for objects reified from HasReify config entries.
+"""
+import asyncio
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from dataclasses import dataclass, field, fields, is_dataclass
+from typing import Any, Callable, Hashable, Iterator, Optional
+
+from praline.config.logging import debug, trace, warning
+from praline.config.model import HasReify, WrappedValue
+
+
+def _freeze(value: Any) -> Hashable:
+    r"""
+    Reduce a config value to something hashable so equal config entries share
+    the same cache key. Falls back to object identity for values we cannot
+    reason about.
+    """
+    if is_dataclass(value):
+        return type(value), tuple((f.name, _freeze(getattr(value, f.name))) for f in fields(value))
+    if isinstance(value, WrappedValue):
+        return type(value), _freeze(value.value())
+    if isinstance(value, dict):
+        return dict, tuple((_freeze(k), _freeze(v)) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return type(value), tuple(_freeze(item) for item in value)
+    try:
+        hash(value)
+        return value
+    except TypeError:
+        return object, id(value)
+
+
+def reify_key(entry: HasReify) -> Hashable:
+    r"""
+    Cache key for a config entry. Two entries with the same type and the same
+    field values produce the same key.
+    """
+    return type(entry), _freeze(entry)
+
+
+def close_quietly(obj: Any) -> None:
+    r"""
+    Default release hook. Calls `close()` on the object if it has one and logs,
+    rather than raises, any failure.
+    """
+    close = getattr(obj, "close", None)
+    if callable(close):
+        try:
+            close()
+        except Exception as ex:
+            warning(f"Could not close reified object: {type(obj)} | {ex}")
+
+
+def iter_reifiable(value: Any, path: str = "") -> Iterator[tuple[str, HasReify]]:
+    r"""
+    Walk a loaded config and yield `(path, entry)` for every HasReify entry,
+    including nested dataclasses, lists and dicts. The config object itself is
+    not yielded.
+    """
+    if is_dataclass(value):
+        for f in fields(value):
+            child = getattr(value, f.name)
+            child_path = f"{path}.{f.name}" if path else f.name
+            if isinstance(child, HasReify):
+                yield child_path, child
+            yield from iter_reifiable(child, child_path)
+    elif isinstance(value, dict):
+        for key, child in value.items():
+            child_path = f"{path}.{key}" if path else str(key)
+            if isinstance(child, HasReify):
+                yield child_path, child
+            yield from iter_reifiable(child, child_path)
+    elif isinstance(value, list):
+        for index, child in enumerate(value):
+            child_path = f"{path}[{index}]"
+            if isinstance(child, HasReify):
+                yield child_path, child
+            yield from iter_reifiable(child, child_path)
+
+
+_NEW = object()
+
+
+class ReifyPool:
+    r"""
+    Bounded pool of objects reified from a single config entry. Intended for
+    resources such as connections, where reusing an instance is much cheaper
+    than creating one.
+
+    Idle objects older than `idle_timeout` seconds are evicted, and
+    `health_check` (when given) is called on an idle object before it is handed
+    out again; objects failing the check are released and replaced. Health
+    checks and `on_release` run without holding the pool's lock, so a slow one
+    only delays its own caller.
+    """
+    def __init__(
+            self,
+            entry: HasReify,
+            max_size: int = 8,
+            idle_timeout: float | None = None,
+            health_check: Callable[[Any], bool] | None = None,
+            on_release: Callable[[Any], None] | None = None,
+    ):
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1.")
+        self.entry = entry
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.health_check = health_check
+        self.on_release = on_release or close_quietly
+        self._idle: list[tuple[Any, float]] = list()
+        self._size: int = 0
+        self._closed: bool = False
+        self._condition = threading.Condition()
+
+    def _discard(self, objs: list[Any]) -> None:
+        r"""
+        Release objects that were already taken out of the pool, then free
+        their slots. Must be called without holding the lock.
+        """
+        for obj in objs:
+            try:
+                self.on_release(obj)
+            finally:
+                with self._condition:
+                    self._size -= 1
+                    self._condition.notify()
+
+    def _is_healthy(self, obj: Any) -> bool:
+        if self.health_check is None:
+            return True
+        try:
+            return bool(self.health_check(obj))
+        except Exception as ex:
+            warning(f"Health check failed for {type(obj)} | {ex}")
+            return False
+
+    def evict_idle(self) -> int:
+        r"""
+        Release idle objects that have exceeded `idle_timeout`. Returns the
+        number of objects evicted.
+        """
+        if self.idle_timeout is None:
+            return 0
+        cutoff = time.monotonic() - self.idle_timeout
+        with self._condition:
+            expired = [obj for obj, since in self._idle if since <= cutoff]
+            self._idle = [(obj, since) for obj, since in self._idle if since > cutoff]
+        self._discard(expired)
+        if expired:
+            debug(f"Evicted {len(expired)} idle object(s) for {type(self.entry)}.")
+        return len(expired)
+
+    def acquire(self, timeout: float | None = None) -> Any:
+        r"""
+        Take an object from the pool, reifying a new one if none are idle and the
+        pool has room. Blocks while the pool is exhausted, raising TimeoutError
+        if `timeout` seconds pass first.
+        """
+        self.evict_idle()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._condition:
+                while True:
+                    if self._closed:
+                        raise RuntimeError(f"Pool for {type(self.entry)} is closed.")
+                    if self._idle:
+                        # Still counted in _size, so the slot stays ours
+                        #  while the health check runs.
+                        obj, _ = self._idle.pop()
+                        break
+                    if self._size < self.max_size:
+                        self._size += 1
+                        obj = _NEW
+                        break
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        raise TimeoutError(f"Timed out waiting for {type(self.entry)} from pool.")
+                    self._condition.wait(remaining)
+
+            if obj is not _NEW:
+                if self._is_healthy(obj):
+                    return obj
+                trace(f"Discarding unhealthy object for {type(self.entry)}.")
+                self._discard([obj])
+                continue
+
+            try:
+                return self.entry.reify()
+            except Exception:
+                with self._condition:
+                    self._size -= 1
+                    self._condition.notify()
+                raise
+
+    def release(self, obj: Any) -> None:
+        r"""
+        Return an object to the pool.
+        """
+        with self._condition:
+            if not self._closed:
+                self._idle.append((obj, time.monotonic()))
+                self._condition.notify()
+                return
+        self._discard([obj])
+
+    @contextmanager
+    def lease(self, timeout: float | None = None) -> Iterator[Any]:
+        r"""
+        Context manager that acquires an object and always returns it.
+        """
+        obj = self.acquire(timeout=timeout)
+        try:
+            yield obj
+        finally:
+            self.release(obj)
+
+    def close(self) -> None:
+        r"""
+        Release every idle object. Objects currently leased are released as they
+        are returned.
+        """
+        with self._condition:
+            self._closed = True
+            idle, self._idle = self._idle, list()
+            self._condition.notify_all()
+        self._discard([obj for obj, _ in idle])
+
+    def __len__(self) -> int:
+        return self._size
+
+
+class ReifyCache:
+    r"""
+    Registry of reified objects keyed by the config value they were built from,
+    so every caller holding an equal config entry shares the same instance.
+
+    Entries that need more than one instance, such as connections, can be
+    pooled with `pool()` instead. Use `replace_config()` when a config is
+    reloaded to release everything the new config no longer references.
+    """
+    def __init__(self, on_release: Callable[[Any], None] | None = None):
+        self.on_release = on_release or close_quietly
+        self._objects: dict[Hashable, Any] = dict()
+        self._pools: dict[Hashable, ReifyPool] = dict()
+        self._key_locks: dict[Hashable, threading.Lock] = dict()
+        self._lock = threading.RLock()
+
+    def get(self, entry: HasReify) -> Any:
+        r"""
+        Return the object reified from `entry`, reifying it on first use.
+        """
+        key = reify_key(entry)
+        while True:
+            with self._lock:
+                if key in self._objects:
+                    return self._objects[key]
+                key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+            # Reify outside the registry lock so unrelated entries don't wait on
+            #  each other's I/O; the key lock keeps one reification per entry.
+            with key_lock:
+                with self._lock:
+                    if key in self._objects:
+                        return self._objects[key]
+                trace(f"Reifying {type(entry)}.")
+                obj = entry.reify()
+                with self._lock:
+                    # The key lock is dropped when the key is released, so a
+                    #  different one means this object is already stale.
+                    current = self._key_locks.get(key) is key_lock
+                    if current:
+                        self._objects[key] = obj
+                if current:
+                    return obj
+            debug(f"{type(entry)} was released while reifying; reifying again.")
+            self.on_release(obj)
+
+    def pool(
+            self,
+            entry: HasReify,
+            max_size: int = 8,
+            idle_timeout: float | None = None,
+            health_check: Callable[[Any], bool] | None = None,
+    ) -> ReifyPool:
+        r"""
+        Return the pool for `entry`, creating it on first use. Pool settings are
+        only applied when the pool is created.
+        """
+        key = reify_key(entry)
+        with self._lock:
+            pool: Optional[ReifyPool] = self._pools.get(key)
+            if pool is None:
+                pool = ReifyPool(
+                    entry,
+                    max_size=max_size,
+                    idle_timeout=idle_timeout,
+                    health_check=health_check,
+                    on_release=self.on_release,
+                )
+                self._pools[key] = pool
+            return pool
+
+    def release(self, entry: HasReify) -> None:
+        r"""
+        Drop the cached object and pool for `entry`, releasing what they hold.
+        """
+        self._release_keys({reify_key(entry)})
+
+    def _release_keys(self, keys: set[Hashable]) -> None:
+        with self._lock:
+            objects = [self._objects.pop(key) for key in keys if key in self._objects]
+            pools = [self._pools.pop(key) for key in keys if key in self._pools]
+            for key in keys:
+                self._key_locks.pop(key, None)
+        for obj in objects:
+            self.on_release(obj)
+        for pool in pools:
+            pool.close()
+
+    def release_config(self, config: Any) -> None:
+        r"""
+        Release everything reified from the HasReify entries found in `config`.
+        """
+        self._release_keys({reify_key(entry) for _, entry in iter_reifiable(config)})
+
+    def replace_config(self, old: Any, new: Any) -> None:
+        r"""
+        Release what was reified from `old` unless an equal entry is still
+        present in `new`, so unchanged resources survive a reload.
+        """
+        retained = {reify_key(entry) for _, entry in iter_reifiable(new)}
+        stale = {reify_key(entry) for _, entry in iter_reifiable(old)} - retained
+        debug(f"Releasing {len(stale)} reified entries no longer in config.")
+        self._release_keys(stale)
+
+    def clear(self) -> None:
+        r"""
+        Release everything held by the cache.
+        """
+        with self._lock:
+            keys = set(self._objects) | set(self._pools)
+        self._release_keys(keys)
+
+    def __len__(self) -> int:
+        return len(self._objects) + len(self._pools)
+
+
+@dataclass
+class ReifyResult:
+    r"""
+    Outcome of reifying a single entry during `reify_all`.
+    """
+    path: str
+    entry: HasReify
+    value: Any = None
+    elapsed: float = 0.0
+    error: Exception | None = None
+
+
+@dataclass
+class ReifyReport:
+    r"""
+    Results of `reify_all`, keyed by entry path, plus the wall time for the
+    whole run.
+    """
+    results: dict[str, ReifyResult] = field(default_factory=dict)
+    elapsed: float = 0.0
+
+    def __getitem__(self, path: str) -> Any:
+        return self.results[path].value
+
+    @property
+    def errors(self) -> dict[str, Exception]:
+        return {path: r.error for path, r in self.results.items() if r.error is not None}
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+
+def _reify_graph(config: Any) -> tuple[dict[str, HasReify], dict[str, set[str]]]:
+    r"""
+    Collect the HasReify entries of `config` with their dependencies, rejecting
+    unknown paths and cycles up front so a bad graph fails before any I/O.
+    """
+    entries: dict[str, HasReify] = dict(iter_reifiable(config))
+    depends: dict[str, set[str]] = dict()
+    for path, entry in entries.items():
+        depends[path] = set(entry.reify_depends_on())
+        unknown = depends[path] - set(entries)
+        if unknown:
+            raise ValueError(f"{path} depends on unknown entries: {sorted(unknown)}")
+
+    visiting: set[str] = set()
+    visited: set[str] = set()
+
+    def visit(path: str):
+        if path in visited:
+            return
+        if path in visiting:
+            raise ValueError(f"Dependency cycle detected at {path}.")
+        visiting.add(path)
+        for dependency in depends[path]:
+            visit(dependency)
+        visiting.discard(path)
+        visited.add(path)
+
+    for path in entries:
+        visit(path)
+    return entries, depends
+
+
+def _reify_timed(path: str, entry: HasReify, cache: ReifyCache | None) -> ReifyResult:
+    result = ReifyResult(path=path, entry=entry)
+    start = time.perf_counter()
+    try:
+        result.value = cache.get(entry) if cache is not None else entry.reify()
+    except Exception as ex:
+        warning(f"Could not reify {path} | {ex}")
+        result.error = ex
+    result.elapsed = time.perf_counter() - start
+    trace(f"Reified {path} in {result.elapsed:.3f}s.")
+    return result
+
+
+def _dependency_failed(path: str, entry: HasReify, dependency: str) -> ReifyResult:
+    return ReifyResult(path=path, entry=entry, error=RuntimeError(f"Dependency {dependency} failed."))
+
+
+def reify_all(
+        config: Any,
+        cache: ReifyCache | None = None,
+        max_workers: int | None = None,
+) -> ReifyReport:
+    r"""
+    Reify every HasReify entry in a loaded config on a thread pool. Entries are
+    started as soon as the entries they depend on (see
+    `HasReify.reify_depends_on`) have finished, so total time tracks the longest
+    dependency chain rather than the sum of all entries.
+
+    Entries whose dependencies fail are skipped and reported as errors.
+    """
+    entries, depends = _reify_graph(config)
+    report = ReifyReport()
+    start = time.perf_counter()
+
+    waiting: dict[str, set[str]] = {path: set(deps) for path, deps in depends.items()}
+    dependents: dict[str, set[str]] = {path: set() for path in entries}
+    for path, deps in depends.items():
+        for dependency in deps:
+            dependents[dependency].add(path)
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="reify") as executor:
+        running: dict[Future, str] = dict()
+
+        def submit_ready():
+            for path in [p for p, deps in waiting.items() if not deps]:
+                del waiting[path]
+                running[executor.submit(_reify_timed, path, entries[path], cache)] = path
+
+        def finish(result: ReifyResult):
+            report.results[result.path] = result
+            for dependent in dependents[result.path]:
+                if dependent not in waiting:
+                    continue
+                if result.error is not None:
+                    del waiting[dependent]
+                    finish(_dependency_failed(dependent, entries[dependent], result.path))
+                else:
+                    waiting[dependent].discard(result.path)
+
+        submit_ready()
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                del running[future]
+                finish(future.result())
+            submit_ready()
+
+    report.elapsed = time.perf_counter() - start
+    debug(f"Reified {len(report.results)} entries in {report.elapsed:.3f}s.")
+    return report
+
+
+async def reify_all_async(
+        config: Any,
+        cache: ReifyCache | None = None,
+) -> ReifyReport:
+    r"""
+    asyncio counterpart of `reify_all`. Each entry is reified in the default
+    executor once the tasks for its dependencies have completed.
+    """
+    entries, depends = _reify_graph(config)
+    report = ReifyReport()
+    start = time.perf_counter()
+    tasks: dict[str, asyncio.Task] = dict()
+
+    async def run(path: str) -> ReifyResult:
+        for dependency in depends[path]:
+            if (await tasks[dependency]).error is not None:
+                result = _dependency_failed(path, entries[path], dependency)
+                break
+        else:
+            result = await asyncio.to_thread(_reify_timed, path, entries[path], cache)
+        report.results[path] = result
+        return result
+
+    for path in entries:
+        tasks[path] = asyncio.ensure_future(run(path))
+    await asyncio.gather(*tasks.values())
+
+    report.elapsed = time.perf_counter() - start
+    debug(f"Reified {len(report.results)} entries in {report.elapsed:.3f}s.")
+    return report
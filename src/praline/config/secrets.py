@@ -0,0 +1,228 @@
+r"""
+Pluggable sources for secret values bound through SecureEnvValue.
+"""
+import threading
+import time
+from abc import abstractmethod
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Iterable, Iterator, Mapping
+
+from dotenv import dotenv_values
+
+from praline.config.context import get_environ
+from praline.config.logging import debug, trace, warning
+
+
+class SecretProvider:
+    r"""
+    Interface for a store that secrets can be read from. Implementations fetch
+    in batches so a config needing many secrets costs one round trip.
+    """
+    @abstractmethod
+    def fetch(self, names: Iterable[str]) -> dict[str, str]:
+        r"""
+        Return the values for `names`. Names without a value are omitted rather
+        than raising.
+        """
+        ...
+
+    def get(self, name: str) -> str | None:
+        return self.fetch([name]).get(name)
+
+
+class EnvSecretProvider(SecretProvider):
+    r"""
+    Reads secrets from the environment; the behavior SecureEnvValue has when no
+    provider is configured.
+    """
+    def fetch(self, names: Iterable[str]) -> dict[str, str]:
+        environ = get_environ()
+        return {name: environ[name] for name in names if name in environ}
+
+
+class FileSecretProvider(SecretProvider):
+    r"""
+    Local stand-in for a secret store. `path` is either a directory holding one
+    file per secret, as mounted by Docker or Kubernetes, or a single dotenv
+    formatted file.
+    """
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+
+    def fetch(self, names: Iterable[str]) -> dict[str, str]:
+        if self.path.is_dir():
+            result: dict[str, str] = dict()
+            for name in names:
+                secret_file = self.path / name
+                if secret_file.is_file():
+                    result[name] = secret_file.read_text().rstrip("\r\n")
+            return result
+
+        values = dotenv_values(self.path)
+        return {name: values[name] for name in names if values.get(name) is not None}
+
+
+class CachedSecretProvider(SecretProvider):
+    r"""
+    Wraps another provider with a TTL cache. Misses are fetched from the wrapped
+    provider in one batch.
+
+    When `refresh_ahead` is set, cached secrets are re-fetched in the background
+    that many seconds before they expire, so callers don't block on the store
+    once the cache is warm. Secrets the store stops returning are dropped. A
+    failed refresh is retried after `retry_interval` seconds, doubling on each
+    further failure up to `ttl`. Call `close()` to stop background refresh.
+    """
+    def __init__(
+            self,
+            provider: SecretProvider,
+            ttl: float = 300.0,
+            refresh_ahead: float | None = None,
+            retry_interval: float = 1.0,
+    ):
+        if refresh_ahead is not None and not 0 < refresh_ahead < ttl:
+            raise ValueError("refresh_ahead must be between 0 and ttl.")
+        if retry_interval <= 0:
+            raise ValueError("retry_interval must be positive.")
+        self.provider = provider
+        self.ttl = ttl
+        self.refresh_ahead = refresh_ahead
+        self.retry_interval = retry_interval
+        self._cache: dict[str, tuple[str, float]] = dict()
+        self._lock = threading.Lock()
+        self._timer: threading.Timer | None = None
+        self._closed: bool = False
+        self._failures: int = 0
+
+    def _store(self, values: Mapping[str, str]) -> None:
+        expires = time.monotonic() + self.ttl
+        with self._lock:
+            for name, value in values.items():
+                self._cache[name] = (value, expires)
+        self._schedule_refresh()
+
+    def fetch(self, names: Iterable[str]) -> dict[str, str]:
+        now = time.monotonic()
+        result: dict[str, str] = dict()
+        missing: list[str] = list()
+        with self._lock:
+            for name in names:
+                cached = self._cache.get(name)
+                if cached is not None and cached[1] > now:
+                    result[name] = cached[0]
+                else:
+                    missing.append(name)
+
+        if missing:
+            trace(f"Fetching {len(missing)} secret(s) from {type(self.provider).__name__}.")
+            fetched = self.provider.fetch(missing)
+            self._store(fetched)
+            result.update(fetched)
+        return result
+
+    def _schedule_refresh(self, not_before: float = 0.0) -> None:
+        if self.refresh_ahead is None:
+            return
+        with self._lock:
+            if self._closed or self._timer is not None or not self._cache:
+                return
+            earliest = min(expires for _, expires in self._cache.values())
+            delay = max(not_before, earliest - self.refresh_ahead - time.monotonic())
+            self._timer = threading.Timer(delay, self._refresh)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _refresh(self) -> None:
+        with self._lock:
+            self._timer = None
+            now = time.monotonic()
+            for name in [name for name, (_, expires) in self._cache.items() if expires <= now]:
+                # Too late to refresh; the next fetch treats it as a miss.
+                del self._cache[name]
+            horizon = now + self.refresh_ahead
+            names = [name for name, (_, expires) in self._cache.items() if expires <= horizon]
+        if not names:
+            self._schedule_refresh()
+            return
+        try:
+            debug(f"Refreshing {len(names)} secret(s) ahead of expiry.")
+            values = self.provider.fetch(names)
+        except Exception as ex:
+            # Keep serving cached values until they actually expire.
+            self._failures += 1
+            backoff = min(self.retry_interval * 2 ** (self._failures - 1), self.ttl)
+            warning(f"Could not refresh secrets, retrying in {backoff:.1f}s | {ex}")
+            self._schedule_refresh(not_before=backoff)
+            return
+        self._failures = 0
+        with self._lock:
+            for name in names:
+                if name not in values:
+                    self._cache.pop(name, None)
+        self._store(values)
+
+    def invalidate(self, names: Iterable[str] | None = None) -> None:
+        r"""
+        Drop cached values for `names`, or everything when `names` is None.
+        """
+        with self._lock:
+            if names is None:
+                self._cache.clear()
+            else:
+                for name in names:
+                    self._cache.pop(name, None)
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+
+class PrefetchedSecretProvider(SecretProvider):
+    r"""
+    Serves values that were fetched ahead of time in a single batch, deferring
+    to `provider` only for names that weren't part of that batch. Prefetched
+    names the provider had no value for stay absent.
+    """
+    def __init__(self, provider: SecretProvider, names: Iterable[str]):
+        self.provider = provider
+        self.names: frozenset[str] = frozenset(names)
+        self.values: dict[str, str] = provider.fetch(list(self.names)) if self.names else dict()
+
+    def fetch(self, names: Iterable[str]) -> dict[str, str]:
+        names = list(names)
+        result = {name: self.values[name] for name in names if name in self.values}
+        missing = [name for name in names if name not in self.names]
+        if missing:
+            result.update(self.provider.fetch(missing))
+        return result
+
+
+_secret_provider: ContextVar[SecretProvider | None] = ContextVar("praline_secret_provider", default=None)
+
+
+@contextmanager
+def use_secret_provider(provider: SecretProvider | None) -> Iterator[SecretProvider | None]:
+    r"""
+    Resolve SecureEnvValue fields through `provider` for the duration of the
+    block. Scoped to the current thread or task.
+    """
+    token = _secret_provider.set(provider)
+    try:
+        yield provider
+    finally:
+        _secret_provider.reset(token)
+
+
+def resolve_secret(name: str) -> str | None:
+    r"""
+    Look up a secret with the active provider, falling back to the environment.
+    """
+    provider = _secret_provider.get()
+    if provider is None:
+        return get_environ().get(name)
+    return provider.get(name)
@@ -0,0 +1,170 @@
+r"""
+Event-based YAML sources for configs with very large list or dict sections.
+
+The sections named when creating a YamlStream are never held in memory as a
+whole. They are bound into the Configuration as StreamedSection placeholders,
+which `load_list` and `load_dict` consume one element at a time straight from
+the file.
+"""
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+import yaml
+from config import Configuration, config_from_dict
+from yaml.events import (AliasEvent, CollectionEndEvent,
+                         CollectionStartEvent, DocumentStartEvent,
+                         MappingEndEvent, MappingStartEvent, NodeEvent,
+                         SequenceEndEvent, SequenceStartEvent)
+
+from praline.config.logging import trace
+
+
+def _next_value(loader: yaml.SafeLoader) -> Any:
+    r"""
+    Compose and construct the next node only, then drop the constructor's
+    bookkeeping so earlier elements can be garbage collected.
+    """
+    node = loader.compose_node(None, None)
+    value = loader.construct_object(node, deep=True)
+    loader.constructed_objects = {}
+    return value
+
+
+def _skip_value(loader: yaml.SafeLoader) -> None:
+    r"""
+    Consume the events for the next node without building it. Anchored nodes
+    are composed and kept, since a later alias may refer to them; everything
+    else is dropped as it is read.
+    """
+    depth = 0
+    while True:
+        event = loader.peek_event()
+        if isinstance(event, NodeEvent) and not isinstance(event, AliasEvent) and event.anchor is not None:
+            loader.compose_node(None, None)
+        else:
+            loader.get_event()
+            if isinstance(event, CollectionStartEvent):
+                depth += 1
+            elif isinstance(event, CollectionEndEvent):
+                depth -= 1
+        if depth == 0:
+            return
+
+
+def _open_document(stream) -> yaml.SafeLoader:
+    loader = yaml.SafeLoader(stream)
+    loader.get_event()
+    if not isinstance(loader.peek_event(), DocumentStartEvent):
+        raise ValueError("Expected a YAML document.")
+    loader.get_event()
+    return loader
+
+
+def _seek_section(loader: yaml.SafeLoader, key: str) -> bool:
+    r"""
+    Advance the loader to the value of the (possibly dotted) `key`. Returns
+    False if the key is not present.
+    """
+    parts = key.split(".")
+    for part in parts:
+        if not loader.check_event(MappingStartEvent):
+            return False
+        loader.get_event()
+        while not loader.check_event(MappingEndEvent):
+            name = _next_value(loader)
+            if str(name) == part:
+                break
+            _skip_value(loader)
+        else:
+            return False
+    return True
+
+
+class StreamedSection:
+    r"""
+    Re-iterable placeholder for a list or dict section of a YAML file. Iterating
+    a list section yields its elements; `items()` on a dict section yields its
+    key/value pairs. Each pass re-reads the file, holding one element at a time.
+    """
+    def __init__(self, path: Path, key: str, kind: type):
+        self.path = path
+        self.key = key
+        self.kind = kind
+
+    def _events(self, start_event: type, end_event: type) -> Iterator[yaml.SafeLoader]:
+        with self.path.open("r") as istream:
+            loader = _open_document(istream)
+            if not _seek_section(loader, self.key) or not loader.check_event(start_event):
+                return
+            loader.get_event()
+            while not loader.check_event(end_event):
+                yield loader
+
+    def __iter__(self) -> Iterator[Any]:
+        if self.kind is dict:
+            for key, _ in self.items():
+                yield key
+            return
+        for loader in self._events(SequenceStartEvent, SequenceEndEvent):
+            yield _next_value(loader)
+
+    def items(self) -> Iterator[tuple[Any, Any]]:
+        if self.kind is not dict:
+            raise TypeError(f"Section {self.key} is a {self.kind.__name__}, not a dict.")
+        for loader in self._events(MappingStartEvent, MappingEndEvent):
+            key = _next_value(loader)
+            yield key, _next_value(loader)
+
+    def __deepcopy__(self, memo) -> "StreamedSection":
+        # Configuration deep-copies values on access; the placeholder is
+        #  immutable and copying it would defeat the point.
+        return self
+
+    def __repr__(self) -> str:
+        return f"<StreamedSection {self.kind.__name__}: {self.path}:{self.key}>"
+
+
+class YamlStream:
+    r"""
+    Configuration source for a YAML file where the `sections` named (top level
+    or dotted keys) are streamed rather than loaded. Everything else in the
+    file is loaded as normal. Pass it anywhere `merge_configs` accepts a source.
+
+    Streamed sections are not merged with other sources. A higher priority
+    source may replace a streamed section with a list or scalar, but loading
+    raises a ValueError if it sets any key inside one, e.g. an override of
+    `routing.rules.first.timeout` with `routing.rules` streamed. A streamed
+    section hides lower priority values for the same key.
+    """
+    def __init__(self, path: str | Path, sections: Iterable[str]):
+        self.path = Path(path)
+        self.sections: set[str] = set(sections)
+
+    def _load_mapping(self, loader: yaml.SafeLoader, prefix: str) -> dict[str, Any]:
+        loader.get_event()
+        result: dict[str, Any] = dict()
+        while not loader.check_event(MappingEndEvent):
+            key = _next_value(loader)
+            full_key = f"{prefix}{key}"
+            event = loader.peek_event()
+            if full_key in self.sections and isinstance(event, CollectionStartEvent):
+                trace(f"Streaming section {full_key} from {self.path}.")
+                kind = dict if isinstance(event, MappingStartEvent) else list
+                result[key] = StreamedSection(self.path, full_key, kind)
+                _skip_value(loader)
+            elif (
+                isinstance(event, MappingStartEvent)
+                and any(s.startswith(f"{full_key}.") for s in self.sections)
+            ):
+                result[key] = self._load_mapping(loader, f"{full_key}.")
+            else:
+                result[key] = _next_value(loader)
+        loader.get_event()
+        return result
+
+    def configuration(self) -> Configuration:
+        with self.path.open("r") as istream:
+            loader = _open_document(istream)
+            if not loader.check_event(MappingStartEvent):
+                raise ValueError(f"{self.path} must contain a mapping at the top level.")
+            return config_from_dict(self._load_mapping(loader, ""))
@@ -0,0 +1,139 @@
+r"""
+Read-only nested view over a merged Configuration.
+
+`Configuration.__getitem__` deep-copies the requested subtree, and a
+ConfigurationSet merges copies from every member, so binding a nested config
+with repeated lookups copies each subtree once per level. ConfigView instead
+builds one nested tree from the merged sources up front and then serves every
+lookup from it without copying.
+"""
+from copy import deepcopy
+from typing import Any, Callable, Iterator, Mapping, Optional
+
+from config import Configuration, ConfigurationSet
+from config.helpers import interpolate_object
+
+from praline.config.logging import warning
+from praline.config.streaming import StreamedSection
+
+Interpolator = Callable[[str, str], Any]
+
+
+def _interpolator(config: Configuration, members: list[Configuration]) -> Optional[Interpolator]:
+    r"""
+    Resolves `{placeholders}` the way lookups on `config` would, against the
+    values of `members`, or None when `config` doesn't interpolate.
+    """
+    if config._interpolate is False:
+        return None
+    context = [dict(member.as_dict()) for member in members]
+    context[0].update(config._interpolate)
+    return lambda key, text: interpolate_object(key, text, context, config._interpolate_type)
+
+
+def _flatten_sources(
+        config: Configuration,
+        interpolator: Optional[Interpolator] = None,
+) -> list[tuple[Configuration, Optional[Interpolator]]]:
+    r"""
+    Member Configurations of a (possibly nested) ConfigurationSet, highest
+    priority first, each with the interpolation that applies to its values.
+    """
+    if isinstance(config, ConfigurationSet):
+        members = config.configs
+        interpolator = _interpolator(config, members) or interpolator
+        result: list[tuple[Configuration, Optional[Interpolator]]] = []
+        for member in members:
+            result.extend(_flatten_sources(member, interpolator))
+        return result
+    return [(config, _interpolator(config, [config]) or interpolator)]
+
+
+def _own(key: str, value: Any, interpolator: Optional[Interpolator]) -> Any:
+    r"""
+    Copy of a source value for the tree, so the view never shares containers
+    with the caller's input, with strings interpolated.
+    """
+    if isinstance(value, Mapping):
+        return {name: _own(key, item, interpolator) for name, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return type(value)(_own(key, item, interpolator) for item in value)
+    if isinstance(value, str) and interpolator is not None:
+        try:
+            return interpolator(key, value)
+        except (KeyError, ValueError) as ex:
+            warning(f"Could not interpolate {key} | {ex!r}")
+    return value
+
+
+def _insert(tree: dict[str, Any], key: str, value: Any) -> None:
+    parts = key.split(".")
+    node = tree
+    for depth, part in enumerate(parts[:-1]):
+        child = node.get(part)
+        if isinstance(child, StreamedSection):
+            raise ValueError(
+                f"Cannot merge {key} into streamed section {'.'.join(parts[:depth + 1])}; "
+                "streamed sections can only be replaced with a list or scalar."
+            )
+        if not isinstance(child, dict):
+            # A higher priority mapping replaces a lower priority leaf.
+            child = node[part] = dict()
+        node = child
+    if isinstance(value, StreamedSection) and isinstance(node.get(parts[-1]), dict):
+        warning(f"Streamed section {key} hides lower priority values for {list(node[parts[-1]])}.")
+    node[parts[-1]] = value
+
+
+class ConfigView(Mapping):
+    r"""
+    Mapping over one node of the merged tree. Nested mappings are returned as
+    ConfigViews over the same tree; nothing is copied on access. Use
+    `as_dict()` when an independent copy is actually needed.
+    """
+    __slots__ = ("_node",)
+
+    def __init__(self, node: dict[str, Any]):
+        self._node = node
+
+    @classmethod
+    def from_configuration(cls, config: Configuration) -> "ConfigView":
+        r"""
+        Build the tree once. Sources are applied from lowest to highest
+        priority, so the result matches ConfigurationSet lookups: a mapping
+        merges key by key, anything else replaces what was there. Values are
+        copied in, and interpolated when their source interpolates.
+        """
+        tree: dict[str, Any] = dict()
+        for source, interpolator in reversed(_flatten_sources(config)):
+            for key, value in source.as_dict().items():
+                _insert(tree, key, _own(key, value, interpolator))
+        return cls(tree)
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            value = self._node[key]
+        except KeyError:
+            if "." not in key:
+                raise
+            # Dotted access, as Configuration allows.
+            head, _, rest = key.partition(".")
+            child = self[head]
+            if not isinstance(child, ConfigView):
+                raise
+            return child[rest]
+        if isinstance(value, dict):
+            return ConfigView(value)
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._node)
+
+    def __len__(self) -> int:
+        return len(self._node)
+
+    def as_dict(self) -> dict[str, Any]:
+        return deepcopy(self._node)
+
+    def __repr__(self) -> str:
+        return f"<ConfigView: {list(self._node)}>"
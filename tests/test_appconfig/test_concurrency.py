@@ -0,0 +1,102 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+import pytest
+
+from praline.config import AppConfigBase
+from praline.config.logging import logging_context
+
+LOADS = 2000
+THREADS = 16
+
+
+class Strict:
+    def __init__(self, value: str):
+        raise ValueError(value)
+
+
+@dataclass
+class Service:
+    host: str = None
+    port: int = None
+
+
+@dataclass
+class AppConfig(AppConfigBase):
+    name: str = None
+    services: list[Service] = None
+    broken: Strict = None
+
+
+@pytest.fixture
+def dotenv_files(tmp_path):
+    paths = []
+    for i in range(4):
+        path = tmp_path / f"{i}.env"
+        path.write_text(f"CONCURRENT_TENANT=dotenv-{i}\nCONCURRENT_SHARED=from-{i}\n")
+        paths.append(path)
+    return paths
+
+
+def load_one(i: int, dotenv_files) -> tuple[int, AppConfig, list[str]]:
+    warnings: list[str] = []
+    with logging_context(warning_logger=warnings.append):
+        app_config = AppConfig.load(
+            dotenv=[dotenv_files[i % len(dotenv_files)]],
+            config={
+                "name": f"tenant-{i}",
+                "services": [{"host": f"host-{i}", "port": i}],
+                "broken": f"broken-{i}",
+                "env": {"tenant": "CONCURRENT_TENANT", "shared": "CONCURRENT_SHARED", "own": "CONCURRENT_OWN"},
+            },
+            environ={"CONCURRENT_OWN": f"own-{i}", "CONCURRENT_SHARED": f"explicit-{i}"} if i % 2 else None,
+        )
+    return i, app_config, warnings
+
+
+def test_concurrent_loads_are_isolated(dotenv_files):
+    assert "CONCURRENT_TENANT" not in os.environ
+    with ThreadPoolExecutor(max_workers=THREADS) as executor:
+        results = list(executor.map(load_one, range(LOADS), [dotenv_files] * LOADS))
+
+    for i, app_config, warnings in results:
+        assert app_config.name == f"tenant-{i}"
+        assert app_config.services == [Service(host=f"host-{i}", port=i)]
+        assert app_config.env["tenant"].value() == f"dotenv-{i % len(dotenv_files)}"
+        if i % 2:
+            assert app_config.env["own"].value() == f"own-{i}"
+            assert app_config.env["shared"].value() == f"explicit-{i}"
+        else:
+            assert app_config.env["own"].value() is None
+            assert app_config.env["shared"].value() == f"from-{i % len(dotenv_files)}"
+        # Each load's warnings went to its own logging context only.
+        assert warnings and all(f"broken-{i}" in w for w in warnings)
+
+    assert "CONCURRENT_TENANT" not in os.environ
+
+
+def test_export_dotenv(dotenv_files):
+    try:
+        app_config = AppConfig.load(
+            dotenv=dotenv_files[:1],
+            config={"env": {"tenant": "CONCURRENT_TENANT"}},
+            export_dotenv=True,
+        )
+        assert app_config.env["tenant"].value() == "dotenv-0"
+        assert os.environ["CONCURRENT_TENANT"] == "dotenv-0"
+    finally:
+        os.environ.pop("CONCURRENT_TENANT", None)
+        os.environ.pop("CONCURRENT_SHARED", None)
+
+
+def test_override_logging_functions_reaches_imported_modules():
+    from praline.config import logging as praline_logging
+    defaults = praline_logging._defaults
+    warnings: list[str] = []
+    try:
+        praline_logging.override_logging_functions(warning_logger=warnings.append)
+        AppConfig.load(config={"broken": "late-override"})
+    finally:
+        praline_logging._defaults = defaults
+    assert any("late-override" in w for w in warnings)
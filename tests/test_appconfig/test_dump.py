@@ -0,0 +1,113 @@
+import json
+import os
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from decimal import Decimal
+from uuid import UUID
+
+import pytest
+
+from praline.config import AppConfigBase, SecureValue
+from praline.config.dump import dump_dataclass, dumps_binary, dumps_json, loads_binary
+from praline.config.helpers import if_any
+
+
+class NonDataclass:
+    def __init__(self, label: str = None, amount: int = None):
+        self.label = label
+        self.amount = amount
+
+    def __eq__(self, other):
+        return vars(self) == vars(other)
+
+
+@dataclass
+class UserObject:
+    name: str = None
+    age: int = None
+
+
+@if_any
+def datetime_factory(val: str | datetime) -> datetime:
+    if isinstance(val, datetime):
+        return val
+    return datetime.fromisoformat(val)
+
+
+@dataclass
+class AppConfig(AppConfigBase):
+    str_field: str = None
+    decimal_field: Decimal = None
+    datetime_field: datetime = field(default_factory=datetime_factory)
+    uuid_field: UUID = None
+    list_field: list = None
+    user_list: list[UserObject] = None
+    user_map: dict[str, UserObject] = None
+    non_dataclass: NonDataclass = None
+    secret: SecureValue = None
+
+
+@pytest.fixture
+def config() -> dict:
+    return {
+        "str_field": "Hello, world!",
+        "decimal_field": "3.14",
+        "datetime_field": "2020-03-03T12:34:56",
+        "uuid_field": "6794f37e-22e7-11ef-b440-971e96ae0c81",
+        "list_field": [1, 2, 3],
+        "user_list": [{"name": "Alice", "age": 20}, {"name": "Bob", "age": 40}],
+        "user_map": {"cfo": {"name": "Bob", "age": 42}},
+        "non_dataclass": {"label": "First", "amount": 100},
+        "secret": "hunter2",
+        "env": {"username": "DUMP_USERNAME"},
+        "secure_env": {"password": "DUMP_PASSWORD"},
+    }
+
+
+@pytest.fixture
+def app_config(config) -> AppConfig:
+    os.environ["DUMP_USERNAME"] = "test-user"
+    os.environ["DUMP_PASSWORD"] = "12345"
+    return AppConfig.load(config=config)
+
+
+def assert_equivalent(loaded: AppConfig, original: AppConfig):
+    for name in ("str_field", "decimal_field", "datetime_field", "uuid_field", "list_field",
+                 "user_list", "user_map", "non_dataclass"):
+        assert getattr(loaded, name) == getattr(original, name)
+    assert loaded.env["username"].value() == "test-user"
+    assert loaded.secure_env["password"].value() == "12345"
+
+
+def test_dump_dataclass(app_config):
+    dumped = dump_dataclass(app_config)
+    assert dumped["user_map"] == {"cfo": {"name": "Bob", "age": 42}}
+    assert dumped["non_dataclass"] == {"label": "First", "amount": 100}
+    assert dumped["secret"] == SecureValue.mask_str
+    # Env entries dump as the variable name, never the resolved value.
+    assert dumped["secure_env"] == {"password": "DUMP_PASSWORD"}
+    assert dump_dataclass(app_config, mask_secure=False)["secret"] == "hunter2"
+
+
+def test_dump_round_trip(app_config):
+    assert_equivalent(AppConfig.load(config=app_config.dump()), app_config)
+
+
+def test_dumps_json_round_trip(app_config):
+    text = dumps_json(app_config)
+    assert "hunter2" not in text and "12345" not in text
+    assert_equivalent(AppConfig.load(config=json.loads(text)), app_config)
+
+
+def test_dumps_binary_round_trip(app_config):
+    data = dumps_binary(app_config, mask_secure=False)
+    loaded = AppConfig.load(config=loads_binary(data))
+    assert_equivalent(loaded, app_config)
+    assert loaded.secret.value() == "hunter2"
+
+
+def test_dump_matches_asdict_for_plain_fields(app_config):
+    expected = asdict(app_config)
+    dumped = app_config.dump()
+    assert dumped["user_list"] == expected["user_list"]
+    assert dumped["user_map"] == expected["user_map"]
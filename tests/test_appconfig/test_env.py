@@ -5,7 +5,7 @@ from dataclasses import dataclass
 import pytest
 from config import config_from_yaml
 
-from praline.config import AppConfigBase
+from praline.config import AppConfigBase, EnvPrefix
 from praline.config.model import SecureValue, SingletonBase
 
 
@@ -46,3 +46,99 @@ def test_secure_env(setup_teardown):
     assert str(app_config.secure_env.get("my_password")) == SecureValue.mask_str
     assert app_config.secure_env.get("my_password").value() == "12345"
     assert app_config.secure_env.get("unmapped_secure_variable") is None
+
+
+@dataclass
+class DatabaseConfig:
+    host: str = None
+    port: int = None
+
+
+@dataclass
+class PrefixConfig(AppConfigBase):
+    name: str = None
+    max_connections: int = None
+    database: DatabaseConfig = None
+    replicas: list[DatabaseConfig] = None
+    labels: dict[str, str] = None
+    ports: dict[str, DatabaseConfig] = None
+    debug: bool = None
+    flags: dict[str, bool] = None
+
+
+@pytest.fixture
+def prefix_environ() -> dict[str, str]:
+    return {
+        "APP_NAME": "from-env",
+        "APP_MAX_CONNECTIONS": "20",
+        "APP_DATABASE__HOST": "db.example.com",
+        "APP_DATABASE__PORT": "5432",
+        "APP_REPLICAS__1__HOST": "replica-1",
+        "APP_REPLICAS__0__HOST": "replica-0",
+        "APP_LABELS__TEAM": "core",
+        "APP_UNKNOWN__FIELD": "ignored",
+        "OTHER_NAME": "not-mine",
+    }
+
+
+def test_env_prefix_trie(prefix_environ):
+    trie = EnvPrefix("APP_", environ=prefix_environ).trie()
+    assert trie["database"] == {"host": "db.example.com", "port": "5432"}
+    assert trie["replicas"] == {"1": {"host": "replica-1"}, "0": {"host": "replica-0"}}
+    assert "other_name" not in trie
+
+
+def test_env_prefix_load(prefix_environ):
+    app_config: PrefixConfig = PrefixConfig.load(
+        config=[config_from_yaml("name: from-yaml\ndatabase:\n  port: 1234\n  host: yaml-host\n")],
+        overrides={"database": {"host": "override-host"}},
+        env_prefix="APP_",
+        environ=prefix_environ,
+    )
+    assert app_config.name == "from-env"
+    assert app_config.max_connections == 20
+    assert app_config.database == DatabaseConfig(host="override-host", port=5432)
+    assert app_config.replicas == [DatabaseConfig(host="replica-0"), DatabaseConfig(host="replica-1")]
+    assert app_config.labels == {"team": "core"}
+
+
+def test_env_prefix_without_other_sources(prefix_environ):
+    app_config: PrefixConfig = PrefixConfig.load(env_prefix="APP_", environ=prefix_environ)
+    assert app_config.database.host == "db.example.com"
+
+
+def test_env_prefix_digit_keys_under_dict():
+    app_config: PrefixConfig = PrefixConfig.load(env_prefix="APP_", environ={
+        "APP_PORTS__8080__HOST": "web",
+        "APP_PORTS__9090__HOST": "metrics",
+    })
+    assert app_config.ports == {"8080": DatabaseConfig(host="web"), "9090": DatabaseConfig(host="metrics")}
+
+
+def test_env_prefix_ignores_stray_index():
+    app_config: PrefixConfig = PrefixConfig.load(env_prefix="APP_", environ={"APP_1": "x", "APP_NAME": "named"})
+    assert app_config.name == "named"
+
+
+def test_env_prefix_rejects_sparse_indexes():
+    assert EnvPrefix("APP_", environ={"APP_A__1": "x"}).configuration().as_dict() == {"a.1": "x"}
+    assert EnvPrefix("APP_", environ={"APP_A__0": "x"}).configuration()["a"] == ["x"]
+
+    app_config: PrefixConfig = PrefixConfig.load(
+        config={"replicas": [{"host": "from-config"}]},
+        env_prefix="APP_",
+        environ={"APP_REPLICAS__3__HOST": "replica-3"},
+    )
+    assert app_config.replicas == [DatabaseConfig(host="from-config")]
+
+
+def test_env_prefix_parses_booleans():
+    app_config: PrefixConfig = PrefixConfig.load(env_prefix="APP_", environ={
+        "APP_DEBUG": "false",
+        "APP_FLAGS__BETA": "True",
+        "APP_FLAGS__LEGACY": "0",
+        "APP_FLAGS__BROKEN": "maybe",
+    })
+    assert app_config.debug is False
+    assert app_config.flags == {"beta": True, "legacy": False}
+    assert PrefixConfig.load(env_prefix="APP_", environ={"APP_DEBUG": "yes"}).debug is True
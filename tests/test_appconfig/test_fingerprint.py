@@ -0,0 +1,136 @@
+from dataclasses import dataclass
+from types import MappingProxyType
+
+import pytest
+
+from praline.config import AppConfigBase, SecureEnvValue
+from praline.config.fingerprint import (_digest, _type_tag, clear_fingerprint,
+                                        diff, fingerprint)
+
+
+@dataclass
+class Route:
+    path: str = None
+    timeout: int = None
+
+
+@dataclass
+class Service:
+    host: str = None
+    routes: list[Route] = None
+
+
+@dataclass
+class AppConfig(AppConfigBase):
+    name: str = None
+    services: dict[str, Service] = None
+
+
+@pytest.fixture
+def config() -> dict:
+    return {
+        "name": "base",
+        "services": {
+            "api": {"host": "api.example.com", "routes": [{"path": "/", "timeout": 5}]},
+            "auth": {"host": "auth.example.com", "routes": [{"path": "/login", "timeout": 2}]},
+        },
+    }
+
+
+def test_equal_configs_have_equal_fingerprints(config):
+    first: AppConfig = AppConfig.load(config=config)
+    second: AppConfig = AppConfig.load(config=config)
+    assert first is not second
+    assert first.fingerprint() == second.fingerprint()
+    assert first.diff(second) == []
+
+
+def test_fingerprint_distinguishes_types():
+    assert fingerprint(1) != fingerprint("1")
+    assert fingerprint({"a": 1, "b": 2}) == fingerprint({"b": 2, "a": 1})
+    assert fingerprint([1, 2]) != fingerprint([2, 1])
+    assert fingerprint(Route(path="/")) != fingerprint(Service(host="/"))
+
+
+def test_diff_reports_changed_paths(config):
+    base: AppConfig = AppConfig.load(config=config)
+    changed = base.derive({"services.api.routes": [{"path": "/", "timeout": 10}], "name": "tenant"})
+    assert sorted(base.diff(changed)) == ["name", "services.api.routes[0].timeout"]
+
+    added = base.derive({"services": {"billing": {"host": "billing.example.com"}}})
+    assert diff(base, added) == ["services.billing"]
+
+
+def test_diff_skips_shared_subtrees(config, monkeypatch):
+    base: AppConfig = AppConfig.load(config=config)
+    derived = base.derive({"services.api.host": "api.internal"})
+    base.fingerprint()
+
+    visited = []
+    original = fingerprint.__globals__["_compute"]
+
+    def counting(value):
+        visited.append(value)
+        return original(value)
+
+    monkeypatch.setitem(fingerprint.__globals__, "_compute", counting)
+    assert base.diff(derived) == ["services.api.host"]
+    # The untouched auth service is shared with base and already hashed.
+    assert base.services["auth"] not in visited
+
+
+def test_clear_fingerprint(config):
+    app_config: AppConfig = AppConfig.load(config=config)
+    before = app_config.fingerprint()
+    app_config.services["api"].host = "changed"
+    assert app_config.fingerprint() == before
+    clear_fingerprint(app_config)
+    assert app_config.fingerprint() != before
+
+
+@dataclass(slots=True)
+class SlotRoute:
+    path: str = None
+    timeout: int = None
+
+
+class Endpoint:
+    __slots__ = ("host", "port")
+
+    def __init__(self, host: str, port: int):
+        self.host = host
+        self.port = port
+
+    def __repr__(self) -> str:
+        return f"<Endpoint {self.host}>"
+
+
+class Opaque:
+    __slots__ = ()
+
+
+def test_slots_fingerprints():
+    assert fingerprint(SlotRoute("/", 5)) == fingerprint(SlotRoute("/", 5))
+    assert fingerprint(SlotRoute("/", 5)) != fingerprint(SlotRoute("/", 6))
+    assert fingerprint(Endpoint("db", 5432)) == fingerprint(Endpoint("db", 5432))
+    assert fingerprint(Endpoint("db", 5432)) != fingerprint(Endpoint("db", 5433))
+    clear_fingerprint(SlotRoute("/", 5))
+
+
+def test_objects_without_state_are_not_hashed_by_repr():
+    opaque = Opaque()
+    assert fingerprint(opaque) == fingerprint(opaque)
+    assert fingerprint(opaque) != fingerprint(Opaque())
+
+
+def test_mappings_hash_like_dicts():
+    assert fingerprint(MappingProxyType({"a": 1})) == fingerprint({"a": 1})
+    assert fingerprint(MappingProxyType({"a": 1})) != fingerprint(MappingProxyType({"a": 2}))
+    assert diff(MappingProxyType({"a": 1, "b": 2}), {"a": 1, "b": 3}) == ["b"]
+
+
+def test_secure_values_are_keyed():
+    secret = SecureEnvValue("hunter2", name="DB_PASSWORD")
+    assert fingerprint(secret) == fingerprint(SecureEnvValue("hunter2", name="DB_PASSWORD"))
+    assert fingerprint(secret) != fingerprint(SecureEnvValue("hunter3", name="DB_PASSWORD"))
+    assert fingerprint(secret) != _digest(_type_tag(secret), fingerprint("hunter2"))
@@ -0,0 +1,108 @@
+from dataclasses import dataclass
+
+import pytest
+
+from praline.config import AppConfigBase
+from praline.config.model import SingletonBase
+from praline.config._base import _expand_dotted, overlay_dataclass
+
+
+@dataclass
+class Route:
+    path: str = None
+    timeout: int = None
+
+
+@dataclass
+class Service:
+    host: str = None
+    port: int = None
+    routes: list[Route] = None
+    labels: dict = None
+
+
+@dataclass
+class AppConfig(AppConfigBase):
+    name: str = None
+    services: dict[str, Service] = None
+    default_route: Route = None
+    raw: dict = None
+
+
+@pytest.fixture
+def base_config() -> dict:
+    return {
+        "name": "base",
+        "services": {
+            "api": {
+                "host": "api.example.com",
+                "port": 80,
+                "routes": [{"path": "/", "timeout": 5}],
+                "labels": {"a": {"x": 1}},
+            },
+            "auth": {"host": "auth.example.com", "port": 443},
+        },
+        "default_route": {"path": "/", "timeout": 30},
+        "raw": {"k": {"a": 1, "b": 2}, "other": {"c": 3}},
+    }
+
+
+def test_expand_dotted():
+    assert _expand_dotted({"a.b": 1, "a": {"c": 2}, "d": 3}) == {"a": {"b": 1, "c": 2}, "d": 3}
+    assert _expand_dotted({"a.b.c": 1, "a.b.d": 2}) == {"a": {"b": {"c": 1, "d": 2}}}
+
+
+def test_derive_matches_full_load(base_config):
+    overrides = {
+        "name": "tenant",
+        "services.api.port": "8080",
+        "services.api.labels.a.y": 2,
+        "default_route": {"timeout": 10},
+        "raw.k.a": 5,
+    }
+    base: AppConfig = AppConfig.load(config=base_config)
+    derived = base.derive(overrides)
+    assert derived == AppConfig.load(config=base_config, overrides=overrides)
+    assert derived.services["api"].port == 8080
+    assert base.services["api"].port == 80
+    assert derived.raw == {"k": {"a": 5, "b": 2}, "other": {"c": 3}}
+    assert derived.raw["other"] is base.raw["other"]
+    assert base.raw["k"] == {"a": 1, "b": 2}
+    assert derived.services["api"].labels == {"a": {"x": 1, "y": 2}}
+
+
+def test_derive_shares_untouched_subtrees(base_config):
+    base: AppConfig = AppConfig.load(config=base_config)
+    derived = overlay_dataclass(base, {"services": {"api": {"port": 8080}}})
+    assert derived.services is not base.services
+    assert derived.services["auth"] is base.services["auth"]
+    assert derived.services["api"].routes is base.services["api"].routes
+    assert derived.default_route is base.default_route
+
+
+def test_derive_adds_new_entries(base_config):
+    base: AppConfig = AppConfig.load(config=base_config)
+    derived = base.derive({"services": {"billing": {"host": "billing.example.com"}}, "unknown": 1})
+    assert derived.services["billing"] == Service(host="billing.example.com")
+    assert "billing" not in base.services
+
+
+@dataclass
+class SingletonConfig(AppConfigBase, SingletonBase):
+    name: str = None
+    default_route: Route = None
+
+
+def test_derive_keeps_singleton(base_config):
+    base: SingletonConfig = SingletonConfig.load(config=base_config)
+    assert SingletonConfig.instance() is base
+    derived = base.derive({"name": "tenant"})
+    assert derived.name == "tenant"
+    assert derived.default_route is base.default_route
+    assert SingletonConfig.instance() is base
+
+
+def test_derive_recomputes_fingerprint(base_config):
+    base: AppConfig = AppConfig.load(config=base_config)
+    base.fingerprint()
+    assert base.derive({"name": "tenant"}).fingerprint() != base.fingerprint()
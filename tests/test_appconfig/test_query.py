@@ -0,0 +1,85 @@
+from dataclasses import dataclass
+from types import MappingProxyType
+
+import pytest
+
+from praline.config import AppConfigBase
+from praline.config.query import compile_query, parse_path
+
+
+@dataclass
+class Route:
+    path: str = None
+    timeout: int = None
+
+
+@dataclass
+class Service:
+    host: str = None
+    routes: list[Route] = None
+    labels: dict = None
+
+
+@dataclass
+class AppConfig(AppConfigBase):
+    name: str = None
+    services: dict[str, Service] = None
+    fallback: Service | None = None
+
+
+@pytest.fixture
+def app_config() -> AppConfig:
+    return AppConfig.load(config={
+        "name": "queries",
+        "services": {
+            "api": {
+                "host": "api.example.com",
+                "routes": [{"path": "/", "timeout": 5}, {"path": "/slow", "timeout": 30}],
+            },
+            "auth": {"host": "auth.example.com", "routes": [{"path": "/login", "timeout": 2}]},
+        },
+    })
+
+
+def test_parse_path():
+    assert parse_path("services.api.routes[0].timeout") == ["services", "api", "routes", "0", "timeout"]
+    assert parse_path('services["a.b"][*]') == ["services", "a.b", "*"]
+    with pytest.raises(ValueError):
+        parse_path("")
+
+
+def test_query(app_config):
+    assert app_config.query("name") == "queries"
+    assert app_config.query("services.api.routes[1].timeout") == 30
+    labelled = AppConfig(services={"a.b": Service(labels={"team.name": "core"})})
+    assert labelled.query("services['a.b'].labels[\"team.name\"]") == "core"
+    assert app_config.query("services.missing.host", default="none") == "none"
+    assert app_config.query("services.auth.routes[5].path") is None
+    assert app_config.query("fallback.host", default="unset") == "unset"
+
+
+def test_query_wildcards(app_config):
+    assert sorted(app_config.query("services.*.host")) == ["api.example.com", "auth.example.com"]
+    assert sorted(app_config.query("services.*.routes[*].timeout")) == [2, 5, 30]
+    assert app_config.query("services.api.routes[*].path") == ["/", "/slow"]
+
+
+def test_compile_query_is_cached_and_validated(app_config):
+    query = AppConfig.compile_query("services.api.host")
+    assert query is compile_query(AppConfig, "services.api.host")
+    assert query.many([app_config, AppConfig()]) == ["api.example.com", None]
+    with pytest.raises(ValueError):
+        AppConfig.compile_query("services.api.hostname")
+    with pytest.raises(ValueError):
+        AppConfig.compile_query("services.api.routes.first")
+
+
+def test_wildcard_over_non_collections_matches_nothing(app_config):
+    assert app_config.query("services.*.host.*") == []
+    assert app_config.query("name.*") == []
+    assert app_config.query("services.*.labels.*") == []
+
+
+def test_wildcard_over_other_mappings():
+    app_config = AppConfig(services=MappingProxyType({"api": Service(host="api.example.com")}))
+    assert app_config.query("services.*.host") == ["api.example.com"]
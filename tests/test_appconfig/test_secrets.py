@@ -0,0 +1,166 @@
+import time
+from dataclasses import dataclass
+from typing import Iterable
+
+import pytest
+
+from praline.config import AppConfigBase, SecureEnvValue, YamlStream
+from praline.config._base import collect_secret_names, merge_configs
+from praline.config.model import SecureValue
+from praline.config.secrets import (CachedSecretProvider, FileSecretProvider,
+                                    SecretProvider, use_secret_provider)
+from praline.config.streaming import StreamedSection
+
+
+class CountingProvider(SecretProvider):
+    def __init__(self, values: dict[str, str]):
+        self.values = values
+        self.calls: list[list[str]] = []
+
+    def fetch(self, names: Iterable[str]) -> dict[str, str]:
+        names = list(names)
+        self.calls.append(names)
+        return {name: self.values[name] for name in names if name in self.values}
+
+
+@dataclass
+class DatabaseConfig:
+    password: SecureEnvValue.for_var = None
+
+
+@dataclass
+class AppConfig(AppConfigBase):
+    database: DatabaseConfig = None
+
+
+@pytest.fixture
+def config() -> dict:
+    return {
+        "secure_env": {"api_key": "API_KEY", "token": "TOKEN"},
+        "database": {"password": "DB_PASSWORD"},
+    }
+
+
+@pytest.fixture
+def secret_dir(tmp_path):
+    (tmp_path / "API_KEY").write_text("key-123\n")
+    (tmp_path / "DB_PASSWORD").write_text("hunter2")
+    return tmp_path
+
+
+def test_collect_secret_names(config):
+    assert collect_secret_names(AppConfig, merge_configs(config)) == {"API_KEY", "TOKEN", "DB_PASSWORD"}
+
+
+def test_load_fetches_secrets_in_one_batch(config):
+    provider = CountingProvider({"API_KEY": "key-123", "TOKEN": "tok", "DB_PASSWORD": "hunter2"})
+    app_config: AppConfig = AppConfig.load(config=config, secret_provider=provider)
+    assert len(provider.calls) == 1
+    assert app_config.secure_env["api_key"].value() == "key-123"
+    assert str(app_config.secure_env["token"]) == SecureValue.mask_str
+    assert app_config.database.password.value() == "hunter2"
+
+
+def test_file_provider_directory(config, secret_dir):
+    app_config: AppConfig = AppConfig.load(config=config, secret_provider=FileSecretProvider(secret_dir))
+    assert app_config.secure_env["api_key"].value() == "key-123"
+    assert app_config.secure_env["token"].value() is None
+    assert app_config.database.password.value() == "hunter2"
+
+
+def test_file_provider_dotenv(tmp_path):
+    secret_file = tmp_path / "secrets.env"
+    secret_file.write_text("API_KEY=key-123\n")
+    provider = FileSecretProvider(secret_file)
+    assert provider.fetch(["API_KEY", "TOKEN"]) == {"API_KEY": "key-123"}
+
+
+def test_use_secret_provider(secret_dir):
+    with use_secret_provider(FileSecretProvider(secret_dir)):
+        assert SecureEnvValue.for_var("API_KEY").value() == "key-123"
+
+
+def test_cached_provider_ttl():
+    source = CountingProvider({"API_KEY": "key-123"})
+    provider = CachedSecretProvider(source, ttl=0.05)
+    assert provider.get("API_KEY") == "key-123"
+    assert provider.get("API_KEY") == "key-123"
+    assert len(source.calls) == 1
+    time.sleep(0.06)
+    provider.get("API_KEY")
+    assert len(source.calls) == 2
+
+
+def test_cached_provider_refresh_ahead():
+    source = CountingProvider({"API_KEY": "key-123"})
+    provider = CachedSecretProvider(source, ttl=0.2, refresh_ahead=0.15)
+    try:
+        provider.get("API_KEY")
+        source.values["API_KEY"] = "key-456"
+        time.sleep(0.1)
+        assert len(source.calls) >= 2
+        assert provider.get("API_KEY") == "key-456"
+    finally:
+        provider.close()
+
+
+class FailingProvider(CountingProvider):
+    def fetch(self, names: Iterable[str]) -> dict[str, str]:
+        result = super().fetch(names)
+        if len(self.calls) > 1:
+            raise ConnectionError("store unavailable")
+        return result
+
+
+def test_cached_provider_backs_off_after_failure():
+    source = FailingProvider({"API_KEY": "key-123"})
+    provider = CachedSecretProvider(source, ttl=0.2, refresh_ahead=0.1, retry_interval=0.2)
+    try:
+        assert provider.get("API_KEY") == "key-123"
+        time.sleep(0.5)
+        assert 2 <= len(source.calls) <= 3
+    finally:
+        provider.close()
+
+
+def test_cached_provider_drops_secrets_no_longer_returned():
+    source = CountingProvider({"API_KEY": "key-123"})
+    provider = CachedSecretProvider(source, ttl=0.2, refresh_ahead=0.1)
+    try:
+        assert provider.get("API_KEY") == "key-123"
+        del source.values["API_KEY"]
+        time.sleep(0.5)
+        assert len(source.calls) == 2
+        assert provider.get("API_KEY") is None
+    finally:
+        provider.close()
+
+
+def test_prefetched_provider_does_not_refetch_absent_secrets():
+    source = CountingProvider({})
+    config = {"secure_env": {f"secret_{i}": f"SECRET_{i}" for i in range(10)}}
+    app_config: AppConfig = AppConfig.load(config=config, secret_provider=source)
+    assert len(source.calls) == 1
+    assert all(value.value() is None for value in app_config.secure_env.values())
+
+
+def test_collect_secret_names_skips_values_without_secrets(tmp_path, monkeypatch):
+    @dataclass
+    class Route:
+        path: str = None
+
+    @dataclass
+    class StreamedConfig(AppConfigBase):
+        routes: list[Route] = None
+
+    path = tmp_path / "config.yaml"
+    path.write_text("secure_env:\n  token: TOKEN\nroutes:\n  - path: /a\n  - path: /b\n")
+    passes = []
+    original = StreamedSection.__iter__
+    monkeypatch.setattr(StreamedSection, "__iter__", lambda self: passes.append(self.key) or original(self))
+
+    provider = CountingProvider({"TOKEN": "tok"})
+    app_config = StreamedConfig.load(config=YamlStream(path, sections=["routes"]), secret_provider=provider)
+    assert provider.calls == [["TOKEN"]]
+    assert app_config.routes == [Route(path="/a"), Route(path="/b")]
+    assert passes == ["routes"]
@@ -0,0 +1,129 @@
+import textwrap
+import tracemalloc
+from dataclasses import dataclass
+
+import pytest
+import yaml
+
+from praline.config import AppConfigBase, YamlStream
+from praline.config._base import merge_configs
+from praline.config.streaming import StreamedSection
+
+
+@dataclass
+class Route:
+    path: str = None
+    timeout: int = None
+
+
+@dataclass
+class Routing:
+    rules: dict[str, Route] = None
+
+
+@dataclass
+class AppConfig(AppConfigBase):
+    name: str = None
+    routes: list[Route] = None
+    routing: Routing = None
+
+
+@pytest.fixture
+def config_file(tmp_path):
+    path = tmp_path / "config.yaml"
+    path.write_text(textwrap.dedent(
+        r"""
+            name: "streamed"
+            routes:
+                - path: "/a"
+                  timeout: 1
+                - path: "/b"
+                  timeout: "2"
+            routing:
+                rules:
+                    first: {"path": "/first", "timeout": 10}
+                    second:
+                        path: "/second"
+                        timeout: 20
+        """
+    ))
+    return path
+
+
+def test_streamed_sections_are_placeholders(config_file):
+    config = merge_configs(YamlStream(config_file, sections=["routes", "routing.rules"]))
+    assert config["name"] == "streamed"
+    assert isinstance(config["routes"], StreamedSection)
+    assert isinstance(config["routing"]["rules"], StreamedSection)
+    assert list(config["routes"])[1] == {"path": "/b", "timeout": "2"}
+
+
+def test_load_from_stream(config_file):
+    app_config: AppConfig = AppConfig.load(
+        config=YamlStream(config_file, sections=["routes", "routing.rules"]),
+        overrides={"name": "overridden"},
+    )
+    assert app_config.name == "overridden"
+    assert app_config.routes == [Route(path="/a", timeout=1), Route(path="/b", timeout=2)]
+    assert app_config.routing.rules == {
+        "first": Route(path="/first", timeout=10),
+        "second": Route(path="/second", timeout=20),
+    }
+
+
+def test_stream_matches_regular_load(config_file):
+    streamed = AppConfig.load(config=YamlStream(config_file, sections=["routes"]))
+    regular = AppConfig.load(config=config_file)
+    assert streamed == regular
+
+
+def test_stream_memory_is_bounded_by_element(tmp_path):
+    path = tmp_path / "large.yaml"
+    with path.open("w") as ostream:
+        ostream.write("routes:\n")
+        for i in range(1000):
+            ostream.write(f"  - {{path: '/route/{i}', timeout: {i}}}\n")
+
+    def peak(fn) -> int:
+        tracemalloc.start()
+        fn()
+        _, result = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return result
+
+    section = merge_configs(YamlStream(path, sections=["routes"]))["routes"]
+    streamed_peak = peak(lambda: sum(route["timeout"] for route in section))
+    full_peak = peak(lambda: yaml.safe_load(path.read_text()))
+    assert streamed_peak * 10 < full_peak
+
+
+def test_stream_rejects_keys_inside_streamed_section(config_file):
+    with pytest.raises(ValueError, match="routing.rules.first.timeout"):
+        AppConfig.load(
+            config=YamlStream(config_file, sections=["routing.rules"]),
+            overrides={"routing.rules.first.timeout": 5},
+        )
+
+
+def test_stream_can_be_replaced(config_file):
+    app_config: AppConfig = AppConfig.load(
+        config=YamlStream(config_file, sections=["routes"]),
+        overrides={"routes": []},
+    )
+    assert app_config.routes == []
+
+
+def test_stream_resolves_aliases_outside_section(tmp_path):
+    path = tmp_path / "aliases.yaml"
+    path.write_text(textwrap.dedent(
+        r"""
+            defaults: &defaults {timeout: 5}
+            name: &name "shared"
+            routes:
+                - {<<: *defaults, path: "/a"}
+                - {<<: *defaults, path: *name, timeout: 7}
+        """
+    ))
+    streamed = AppConfig.load(config=YamlStream(path, sections=["routes"]))
+    assert streamed.routes == [Route(path="/a", timeout=5), Route(path="shared", timeout=7)]
+    assert streamed.routes == AppConfig.load(config=path).routes
@@ -0,0 +1,123 @@
+import json
+from dataclasses import dataclass
+
+import config.configuration
+from config import config_from_dict
+
+from praline.config import AppConfigBase
+from praline.config._base import load_complex, load_dataclass, merge_configs
+from praline.config.fingerprint import fingerprint
+from praline.config.view import ConfigView
+
+
+class Connection:
+    def __init__(self, host: str = None, options: dict = None):
+        self.host = host
+        self.options = options
+
+
+@dataclass
+class Service:
+    host: str = None
+    labels: dict = None
+    connection: Connection = None
+
+
+@dataclass
+class AppConfig(AppConfigBase):
+    name: str = None
+    services: dict[str, Service] = None
+
+
+def test_view_matches_configuration_set_priority():
+    merged = merge_configs([
+        config_from_dict({"a": 5, "b": {"c": 1}}),
+        [{"a": {"x": 1}, "b": {"d": 2}}, {"e": [1, 2]}],
+    ])
+    view = ConfigView.from_configuration(merged)
+    assert view["a"] == merged["a"] == 5
+    assert dict(view["b"]) == {"c": 1, "d": 2}
+    assert view["b.d"] == 2
+    assert view["e"] == [1, 2]
+    assert isinstance(view["b"], ConfigView)
+
+
+def test_view_access_does_not_copy():
+    view = ConfigView.from_configuration(config_from_dict({"a": {"b": {"c": [1, 2]}}}))
+    assert view["a"]["b"]["c"] is view["a.b.c"]
+    assert view.as_dict() == {"a": {"b": {"c": [1, 2]}}}
+    assert view.as_dict()["a"]["b"]["c"] is not view["a.b.c"]
+
+
+def test_view_copies_leaf_lists():
+    hosts = [{"name": "a"}, {"name": "b"}]
+    view = ConfigView.from_configuration(config_from_dict({"cluster": {"hosts": hosts}}))
+    assert view["cluster.hosts"] == hosts
+    assert view["cluster.hosts"] is not hosts
+    assert view["cluster.hosts"][0] is not hosts[0]
+
+
+def test_view_interpolates():
+    view = ConfigView.from_configuration(merge_configs([
+        config_from_dict({"host": "db", "url": "postgres://{host}/x"}, interpolate=True),
+        {"raw": "{host}"},
+    ]))
+    assert view["url"] == "postgres://db/x"
+    assert view["raw"] == "{host}"
+
+
+def test_load_interpolated():
+    @dataclass
+    class Database(AppConfigBase):
+        host: str = None
+        url: str = None
+
+    database = Database.load(config=config_from_dict({"host": "db", "url": "postgres://{host}/x"}, interpolate=True))
+    assert database.url == "postgres://db/x"
+
+
+def test_load_complex_with_view():
+    result = load_complex(Connection, config_from_dict({"host": "db", "options": {"ssl": True}}))
+    assert result.host == "db"
+    assert type(result.options) is dict
+    assert result.options == {"ssl": True}
+
+
+def test_load_nested_dicts_under_typed_dict(monkeypatch):
+    merged = merge_configs({
+        "name": "view",
+        "services": {
+            "api": {
+                "host": "api.example.com",
+                "labels": {"team": "core"},
+                "connection": {"host": "db", "options": {"pool": {"size": 4}}},
+            },
+        },
+    })
+    copies = []
+    original = config.configuration.deepcopy
+    monkeypatch.setattr(config.configuration, "deepcopy", lambda v, *a: copies.append(v) or original(v, *a))
+
+    app_config: AppConfig = load_dataclass(AppConfig, merged)
+    assert copies == []
+    api = app_config.services["api"]
+    assert api.labels == {"team": "core"}
+    assert api.connection.host == "db"
+    assert api.connection.options["pool"]["size"] == 4
+
+
+def test_untyped_dict_fields_hold_plain_dicts():
+    app_config = AppConfig.load(config={
+        "services": {
+            "api": {
+                "labels": {"team": {"name": "core"}},
+                "connection": {"host": "db", "options": {"pool": {"size": 4}}},
+            },
+        },
+    })
+    api = app_config.services["api"]
+    assert type(api.labels) is dict
+    assert type(api.labels["team"]) is dict
+    assert type(api.connection.options["pool"]) is dict
+    assert json.loads(json.dumps(app_config.dump()))["services"]["api"]["labels"] == {"team": {"name": "core"}}
+    assert fingerprint(api.labels) == fingerprint({"team": {"name": "core"}})
@@ -1,3 +1,4 @@
+import csv
 import tempfile
 from pathlib import Path
 
@@ -56,3 +57,25 @@ def test_csv_to_nested_dict_delimiter(csv_file):
     }
     result = csv_to_nested_dict(csv_file, key_fields, key_delimiter=delimiter)
     assert result == expected_output
+
+
+@pytest.fixture
+def large_csv_file(tmp_path):
+    csv_path = tmp_path / "large.csv"
+    with csv_path.open('w', newline='') as ostream:
+        writer = csv.writer(ostream)
+        writer.writerow(['id', 'name', 'note'])
+        for i in range(2000):
+            note = f'line one\nline "two", row {i}' if i % 7 == 0 else f'plain {i}'
+            writer.writerow([i % 1500, f'name-{i}', note])
+    return csv_path
+
+
+def test_csv_to_nested_dict_parallel(large_csv_file):
+    expected = csv_to_nested_dict(large_csv_file, ['id'])
+    result = csv_to_nested_dict(large_csv_file, ['id'], workers=4, chunk_size=4096)
+    assert result == expected
+    assert list(result) == list(expected)
+    # Duplicate keys keep the last row in the file, as in sequential mode.
+    assert result['0']['name'] == 'name-1500'
+    assert result['504']['note'] == 'line one\nline "two", row 504'
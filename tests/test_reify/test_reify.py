@@ -0,0 +1,240 @@
+import asyncio
+import threading
+import time
+from dataclasses import dataclass
+
+import pytest
+
+from praline.config import AppConfigBase
+from praline.config.model import HasReify
+from praline.config.reify import (ReifyCache, ReifyPool, iter_reifiable,
+                                  reify_all, reify_all_async)
+
+
+class Connection:
+    def __init__(self, url: str):
+        self.url = url
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+@dataclass
+class DatabaseConfig(HasReify):
+    url: str = None
+
+    def reify(self) -> Connection:
+        return Connection(self.url)
+
+
+@dataclass
+class AppConfig(AppConfigBase):
+    database: DatabaseConfig = None
+    replicas: list[DatabaseConfig] = None
+
+
+def test_cache_shares_equal_entries():
+    cache = ReifyCache()
+    first = cache.get(DatabaseConfig(url="db://one"))
+    assert cache.get(DatabaseConfig(url="db://one")) is first
+    assert cache.get(DatabaseConfig(url="db://two")) is not first
+
+
+def test_cache_release():
+    cache = ReifyCache()
+    entry = DatabaseConfig(url="db://one")
+    conn = cache.get(entry)
+    cache.release(entry)
+    assert conn.closed
+    assert cache.get(entry) is not conn
+
+
+reifying: list[Connection] = []
+unblock = threading.Event()
+
+
+@dataclass
+class BlockingConfig(HasReify):
+    url: str = None
+
+    def reify(self) -> Connection:
+        conn = Connection(self.url)
+        reifying.append(conn)
+        if len(reifying) == 1:
+            unblock.wait(5)
+        return conn
+
+
+def test_release_during_reify_does_not_cache_stale_object():
+    cache = ReifyCache()
+    entry = BlockingConfig(url="db://one")
+    result = []
+    getter = threading.Thread(target=lambda: result.append(cache.get(entry)))
+    getter.start()
+    while not reifying:
+        time.sleep(0.001)
+    cache.release(entry)
+    unblock.set()
+    getter.join()
+
+    stale, fresh = reifying
+    assert stale.closed
+    assert result == [fresh]
+    assert not fresh.closed
+    assert cache.get(entry) is fresh
+
+
+def test_replace_config_releases_stale_entries():
+    cache = ReifyCache()
+    old = AppConfig.load(config={"database": {"url": "db://main"}, "replicas": [{"url": "db://r1"}]})
+    new = AppConfig.load(config={"database": {"url": "db://main"}, "replicas": [{"url": "db://r2"}]})
+    main = cache.get(old.database)
+    replica = cache.get(old.replicas[0])
+
+    cache.replace_config(old, new)
+    assert not main.closed
+    assert replica.closed
+    assert cache.get(new.database) is main
+
+
+def test_iter_reifiable():
+    app_config = AppConfig.load(config={"database": {"url": "db://main"}, "replicas": [{"url": "db://r1"}]})
+    paths = [path for path, _ in iter_reifiable(app_config)]
+    assert paths == ["database", "replicas[0]"]
+
+
+def test_pool_reuses_and_limits():
+    pool = ReifyPool(DatabaseConfig(url="db://one"), max_size=1)
+    with pool.lease() as conn:
+        with pytest.raises(TimeoutError):
+            pool.acquire(timeout=0.01)
+    assert pool.acquire() is conn
+
+
+def test_pool_health_check_and_close():
+    pool = ReifyPool(DatabaseConfig(url="db://one"), health_check=lambda c: not c.closed)
+    conn = pool.acquire()
+    pool.release(conn)
+    conn.closed = True
+    replacement = pool.acquire()
+    assert replacement is not conn
+
+    pool.release(replacement)
+    pool.close()
+    assert replacement.closed
+    with pytest.raises(RuntimeError):
+        pool.acquire()
+
+
+def test_pool_idle_eviction():
+    pool = ReifyPool(DatabaseConfig(url="db://one"), idle_timeout=0)
+    conn = pool.acquire()
+    pool.release(conn)
+    assert pool.evict_idle() == 1
+    assert conn.closed
+    assert len(pool) == 0
+
+
+def test_pool_slow_checks_do_not_block_other_acquires():
+    started = threading.Event()
+    finish = threading.Event()
+
+    def slow(conn: Connection) -> bool:
+        started.set()
+        return finish.wait(5)
+
+    pool = ReifyPool(DatabaseConfig(url="db://one"), max_size=2, health_check=slow, on_release=slow)
+    pool.release(pool.acquire())
+    checker = threading.Thread(target=pool.acquire)
+    checker.start()
+    assert started.wait(1)
+    conn = pool.acquire(timeout=0.5)
+    assert checker.is_alive()
+    assert len(pool) == 2
+    finish.set()
+    checker.join()
+
+    started.clear()
+    finish.clear()
+    pool.release(conn)
+    closer = threading.Thread(target=pool.close)
+    closer.start()
+    assert started.wait(1)
+    with pytest.raises(RuntimeError):
+        pool.acquire(timeout=0.5)
+    assert closer.is_alive()
+    finish.set()
+    closer.join()
+
+
+@dataclass
+class SlowService(HasReify):
+    name: str = None
+    delay: float = None
+    depends_on: list[str] = None
+    fail: bool = False
+
+    def reify_depends_on(self) -> list[str]:
+        return self.depends_on or []
+
+    def reify(self) -> tuple[str, float]:
+        time.sleep(self.delay or 0.05)
+        if self.fail:
+            raise RuntimeError(f"{self.name} failed")
+        return self.name, time.monotonic()
+
+
+@dataclass
+class StartupConfig(AppConfigBase):
+    services: dict[str, SlowService] = None
+
+
+def startup_config(**overrides) -> StartupConfig:
+    services = {
+        "database": {"name": "database"},
+        "cache": {"name": "cache"},
+        "queue": {"name": "queue"},
+        "api": {"name": "api", "depends_on": ["services.database", "services.cache"]},
+    }
+    for key, value in overrides.items():
+        services[key].update(value)
+    return StartupConfig.load(config={"services": services})
+
+
+def test_reify_all_concurrent_with_dependencies():
+    report = reify_all(startup_config(), max_workers=4)
+    assert report.ok
+    assert set(report.results) == {"services.database", "services.cache", "services.queue", "services.api"}
+    # Independent entries overlap, so the run takes about two entries' time rather than four.
+    assert report.elapsed < 0.05 * 4
+    _, api_started = report["services.api"]
+    assert api_started > report["services.database"][1]
+    assert all(r.elapsed >= 0.05 for r in report.results.values())
+
+
+def test_reify_all_skips_dependents_of_failures():
+    report = reify_all(startup_config(database={"fail": True}))
+    assert set(report.errors) == {"services.database", "services.api"}
+    assert report["services.cache"][0] == "cache"
+
+
+def test_reify_all_rejects_bad_graphs():
+    with pytest.raises(ValueError):
+        reify_all(startup_config(queue={"depends_on": ["services.missing"]}))
+    with pytest.raises(ValueError):
+        reify_all(startup_config(database={"depends_on": ["services.api"]}))
+
+
+def test_reify_all_uses_cache():
+    cache = ReifyCache()
+    app_config = startup_config()
+    report = reify_all(app_config, cache=cache)
+    assert cache.get(app_config.services["queue"]) is report["services.queue"]
+
+
+def test_reify_all_async():
+    report = asyncio.run(reify_all_async(startup_config(database={"fail": True})))
+    assert report.elapsed < 0.05 * 4
+    assert set(report.errors) == {"services.database", "services.api"}
+    assert report["services.queue"][0] == "queue"